@@ -1,23 +1,42 @@
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
-from typing import Optional, Literal
-import time
+from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Optional, Literal, Tuple
+import orjson
 
-from src.core.converters import genbank_to_fasta, get_conversion_summary, ConversionError
+from src.core.converters import genbank_to_fasta_with_summary, ConversionError
+from src.core.workers import run_in_pool
 from src.utils.validators import (
-    validate_input_format, 
-    validate_content_size, 
     validate_genbank_format,
-    ValidationError
+    ValidationError,
+    MAX_BATCH_ITEMS
 )
-from src.utils.logging import audit_logger, logger
+from src.api.dependencies import (
+    SequenceContent,
+    enforce_content_length,
+    json_body,
+    json_body_openapi
+)
+from src.utils.audit import audited
+from src.utils.logging import logger
+from src.utils.streaming import fasta_stream_response
+
 
+router = APIRouter(default_response_class=ORJSONResponse)
 
-router = APIRouter()
+_ERR_MAP = {
+    ValidationError: (400, logger.warning, "Validation error"),
+    ConversionError: (422, logger.error, "Conversion error"),
+}
 
 
 class GenBankToFastaRequest(BaseModel):
-    content: str = Field(..., description="GenBank file content")
+    model_config = ConfigDict(extra="forbid")
+    
+    content: SequenceContent = Field(
+        ...,
+        description="GenBank file content"
+    )
     input_format: Literal["string", "base64"] = Field(
         default="string", 
         description="Format of input content"
@@ -28,6 +47,9 @@ class GenBankToFastaRequest(BaseModel):
     )
 
 
+_genbank_request = json_body(GenBankToFastaRequest)
+
+
 class GenBankToFastaResponse(BaseModel):
     fasta_content: str
     success: bool = True
@@ -35,137 +57,179 @@ class GenBankToFastaResponse(BaseModel):
     execution_time_ms: float
 
 
-@router.post("/genbank-to-fasta", response_model=GenBankToFastaResponse)
-async def convert_genbank_to_fasta(request: GenBankToFastaRequest):
-    start_time = time.time()
-    operation = "genbank_to_fasta_conversion"
+class BatchConvertRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
     
-    try:
-        validate_input_format(request.input_format)
-        validate_content_size(request.content)
-        
-        if request.input_format == "string":
-            validate_genbank_format(request.content)
-        
-        fasta_result = genbank_to_fasta(
-            request.content, 
-            input_format=request.input_format
+    items: List[GenBankToFastaRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_ITEMS,
+        description="GenBank inputs to convert"
+    )
+
+
+_batch_convert_request = json_body(BatchConvertRequest)
+
+
+class BatchConvertItem(BaseModel):
+    fasta_content: str
+    conversion_summary: Optional[dict] = None
+
+
+class BatchConvertResponse(BaseModel):
+    results: List[BatchConvertItem]
+    success: bool = True
+    execution_time_ms: float
+
+
+def _convert(content: str, input_format: str) -> Tuple[str, dict]:
+    if input_format == "string":
+        validate_genbank_format(content)
+    
+    return genbank_to_fasta_with_summary(content, input_format=input_format)
+
+
+async def _run_conversion(
+    request: GenBankToFastaRequest,
+    endpoint: str,
+    include_summary: bool
+) -> Tuple[str, Optional[dict], float]:
+    params = {
+        "input_format": request.input_format,
+        "include_summary": include_summary,
+        "content_length": len(request.content) if request.content else 0
+    }
+    
+    async with audited("genbank_to_fasta_conversion", endpoint, params, _ERR_MAP) as audit:
+        fasta_result, conversion_summary = await run_in_pool(
+            _convert,
+            request.content,
+            request.input_format
         )
-        
-        conversion_summary = None
-        if request.include_summary:
-            conversion_summary = get_conversion_summary(
-                request.content, 
-                input_format=request.input_format
-            )
-        
-        execution_time = (time.time() - start_time) * 1000
-        
-        response = GenBankToFastaResponse(
+        if not include_summary:
+            conversion_summary = None
+        
+        audit.set_result({
+            "output_length": len(fasta_result),
+            "conversion_summary": conversion_summary
+        })
+        execution_time = audit.elapsed_ms()
+    
+    logger.info("GenBank to FASTA conversion completed in %.2fms", execution_time)
+    
+    return fasta_result, conversion_summary, execution_time
+
+
+@router.post(
+    "/genbank-to-fasta",
+    response_model=GenBankToFastaResponse,
+    openapi_extra=json_body_openapi(GenBankToFastaRequest),
+    dependencies=[Depends(enforce_content_length)]
+)
+async def convert_genbank_to_fasta(
+    request: GenBankToFastaRequest = Depends(_genbank_request)
+):
+    fasta_result, conversion_summary, execution_time = await _run_conversion(
+        request,
+        endpoint="/convert/genbank-to-fasta",
+        include_summary=request.include_summary
+    )
+    
+    return GenBankToFastaResponse(
+        fasta_content=fasta_result,
+        conversion_summary=conversion_summary,
+        execution_time_ms=round(execution_time, 2)
+    )
+
+
+@router.post(
+    "/genbank-to-fasta/stream",
+    response_class=StreamingResponse,
+    openapi_extra=json_body_openapi(GenBankToFastaRequest),
+    dependencies=[Depends(enforce_content_length)]
+)
+async def convert_genbank_to_fasta_stream(
+    request: GenBankToFastaRequest = Depends(_genbank_request)
+):
+    fasta_result, _, execution_time = await _run_conversion(
+        request,
+        endpoint="/convert/genbank-to-fasta/stream",
+        include_summary=False
+    )
+    
+    return fasta_stream_response(fasta_result, execution_time)
+
+
+def _convert_batch(items: List[GenBankToFastaRequest]) -> List[BatchConvertItem]:
+    results = []
+    for i, item in enumerate(items):
+        try:
+            fasta_result, conversion_summary = _convert(item.content, item.input_format)
+        except (ValidationError, ConversionError) as e:
+            raise type(e)(f"item {i}: {str(e)}")
+        
+        results.append(BatchConvertItem(
             fasta_content=fasta_result,
-            conversion_summary=conversion_summary,
-            execution_time_ms=round(execution_time, 2)
-        )
-        
-        audit_logger.log_operation(
-            operation=operation,
-            endpoint="/convert/genbank-to-fasta",
-            parameters={
-                "input_format": request.input_format,
-                "include_summary": request.include_summary,
-                "content_length": len(request.content)
-            },
-            success=True,
-            execution_time_ms=execution_time,
-            result_summary={
-                "output_length": len(fasta_result),
-                "conversion_summary": conversion_summary
-            }
-        )
-        
-        logger.info(f"GenBank to FASTA conversion completed in {execution_time:.2f}ms")
-        
-        return response
-        
-    except ValidationError as e:
-        execution_time = (time.time() - start_time) * 1000
-        error_msg = f"Validation error: {str(e)}"
-        
-        audit_logger.log_operation(
-            operation=operation,
-            endpoint="/convert/genbank-to-fasta",
-            parameters={
-                "input_format": request.input_format,
-                "include_summary": request.include_summary,
-                "content_length": len(request.content) if request.content else 0
-            },
-            success=False,
-            execution_time_ms=execution_time,
-            result_summary={},
-            error_message=error_msg
-        )
-        
-        logger.warning(error_msg)
-        raise HTTPException(status_code=400, detail=error_msg)
-        
-    except ConversionError as e:
-        execution_time = (time.time() - start_time) * 1000
-        error_msg = f"Conversion error: {str(e)}"
-        
-        audit_logger.log_operation(
-            operation=operation,
-            endpoint="/convert/genbank-to-fasta",
-            parameters={
-                "input_format": request.input_format,
-                "include_summary": request.include_summary,
-                "content_length": len(request.content) if request.content else 0
-            },
-            success=False,
-            execution_time_ms=execution_time,
-            result_summary={},
-            error_message=error_msg
-        )
-        
-        logger.error(error_msg)
-        raise HTTPException(status_code=422, detail=error_msg)
-        
-    except Exception as e:
-        execution_time = (time.time() - start_time) * 1000
-        error_msg = f"Unexpected error: {str(e)}"
-        
-        audit_logger.log_operation(
-            operation=operation,
-            endpoint="/convert/genbank-to-fasta",
-            parameters={
-                "input_format": request.input_format,
-                "include_summary": request.include_summary,
-                "content_length": len(request.content) if request.content else 0
-            },
-            success=False,
-            execution_time_ms=execution_time,
-            result_summary={},
-            error_message=error_msg
-        )
-        
-        logger.error(error_msg)
-        raise HTTPException(status_code=500, detail="Internal server error")
+            conversion_summary=conversion_summary if item.include_summary else None
+        ))
+    return results
+
+
+@router.post(
+    "/genbank-to-fasta/batch",
+    response_model=BatchConvertResponse,
+    openapi_extra=json_body_openapi(BatchConvertRequest),
+    dependencies=[Depends(enforce_content_length)]
+)
+async def convert_genbank_to_fasta_batch(
+    request: BatchConvertRequest = Depends(_batch_convert_request)
+):
+    params = {
+        "items": len(request.items),
+        "content_length": sum(len(item.content) for item in request.items)
+    }
+    
+    async with audited("genbank_to_fasta_batch", "/convert/genbank-to-fasta/batch", params, _ERR_MAP) as audit:
+        results = await run_in_pool(_convert_batch, request.items)
+        
+        audit.set_result({
+            "n": len(results),
+            "total_output": sum(len(r.fasta_content) for r in results)
+        })
+        execution_time = audit.elapsed_ms()
+    
+    logger.info("GenBank to FASTA batch of %d completed in %.2fms", len(results), execution_time)
+    
+    return BatchConvertResponse(
+        results=results,
+        execution_time_ms=round(execution_time, 2)
+    )
+
+
+_FORMATS_BYTES = orjson.dumps({
+    "supported_conversions": [
+        {
+            "from": "genbank",
+            "to": "fasta",
+            "endpoint": "/convert/genbank-to-fasta",
+            "stream_endpoint": "/convert/genbank-to-fasta/stream",
+            "batch_endpoint": "/convert/genbank-to-fasta/batch",
+            "description": "Convert GenBank format to FASTA format"
+        }
+    ],
+    "input_formats": ["string", "base64"],
+    "features": [
+        "Conversion summary statistics",
+        "Multiple record support",
+        "Error handling and validation"
+    ]
+})
 
 
 @router.get("/formats")
 async def get_supported_formats():
-    return {
-        "supported_conversions": [
-            {
-                "from": "genbank",
-                "to": "fasta",
-                "endpoint": "/convert/genbank-to-fasta",
-                "description": "Convert GenBank format to FASTA format"
-            }
-        ],
-        "input_formats": ["string", "base64"],
-        "features": [
-            "Conversion summary statistics",
-            "Multiple record support",
-            "Error handling and validation"
-        ]
-    }
\ No newline at end of file
+    return Response(
+        _FORMATS_BYTES,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=3600"}
+    )
@@ -0,0 +1,114 @@
+"""
+Shared FastAPI dependencies for the API routers.
+"""
+from typing import Annotated, Any, Callable, Dict, Type, TypeVar
+
+from fastapi import HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import AfterValidator, BaseModel, Field, ValidationError as PydanticValidationError
+
+from src.utils.validators import MAX_CONTENT_LENGTH, MAX_REQUEST_LENGTH
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+OPENAPI_REF_TEMPLATE = "#/components/schemas/{model}"
+
+# Request body schemas collected by json_body_openapi, keyed by model name
+_json_body_components: Dict[str, Dict[str, Any]] = {}
+
+
+def _content_within_limit(content: str) -> str:
+    # max_length counts characters; only non-ASCII text can be larger in bytes
+    if not content.isascii() and len(content.encode("utf-8")) > MAX_CONTENT_LENGTH:
+        raise ValueError(f"Content exceeds maximum allowed size ({MAX_CONTENT_LENGTH} bytes)")
+    return content
+
+
+# Request ``content`` field: at most MAX_CONTENT_LENGTH bytes once UTF-8 encoded
+SequenceContent = Annotated[
+    str,
+    Field(max_length=MAX_CONTENT_LENGTH),
+    AfterValidator(_content_within_limit)
+]
+
+
+def content_length_limit(max_length: int) -> Callable:
+    """
+    Build a dependency that rejects requests whose Content-Length header
+    exceeds ``max_length`` with a 413, before any of the body is read.
+    """
+    async def dependency(request: Request):
+        content_length = request.headers.get("content-length")
+        if content_length is None:
+            return
+        
+        try:
+            size = int(content_length)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid Content-Length header")
+        
+        if size > max_length:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Request body ({size} bytes) exceeds maximum allowed size ({max_length} bytes)"
+            )
+
+    return dependency
+
+
+enforce_content_length = content_length_limit(MAX_REQUEST_LENGTH)
+
+
+def json_body(model: Type[ModelT]) -> Callable:
+    """
+    Build a dependency that validates the raw request body against ``model``.
+
+    The body bytes go straight into pydantic-core's JSON parser, skipping the
+    intermediate ``json.loads`` dict that FastAPI builds for body parameters.
+    Validation failures surface as the usual 422 ``RequestValidationError``,
+    without echoing the offending input back since it can be the whole body.
+    """
+    async def dependency(request: Request) -> ModelT:
+        body = await request.body()
+        try:
+            return model.model_validate_json(body)
+        except PydanticValidationError as e:
+            raise RequestValidationError([
+                {"type": error["type"], "loc": ("body", *error["loc"]), "msg": error["msg"]}
+                for error in e.errors()
+            ])
+
+    return dependency
+
+
+def json_body_openapi(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    OpenAPI ``requestBody`` for routes that read their body through ``json_body``.
+
+    The body is a ``$ref`` into ``components.schemas``; the model and the
+    models nested in it are registered there by ``add_json_body_components``
+    when the OpenAPI document is built.
+    """
+    schema = model.model_json_schema(ref_template=OPENAPI_REF_TEMPLATE)
+    _json_body_components.update(schema.pop("$defs", {}))
+    _json_body_components[model.__name__] = schema
+    
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"$ref": OPENAPI_REF_TEMPLATE.format(model=model.__name__)}
+                }
+            },
+        }
+    }
+
+
+def add_json_body_components(openapi_schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Register the ``json_body_openapi`` schemas under ``components.schemas``."""
+    schemas = openapi_schema.setdefault("components", {}).setdefault("schemas", {})
+    for name, schema in _json_body_components.items():
+        schemas.setdefault(name, schema)
+    return openapi_schema
@@ -1,12 +1,15 @@
 from fastapi import APIRouter, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any, Literal
 import time
 
 from src.utils.logging import audit_logger, logger
+from src.utils import audit_queue
+from src.utils.timing import elapsed_ms
 
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 class LogsResponse(BaseModel):
@@ -27,11 +30,12 @@ async def get_logs(
     operation: Optional[str] = Query(default=None, description="Filter by operation type"),
     success_only: Optional[bool] = Query(default=None, description="Filter by success status")
 ):
-    start_time = time.time()
+    t0 = time.perf_counter_ns()
     
     try:
-        all_logs = audit_logger.get_logs()
-        total_count = len(all_logs)
+        audit_queue.flush()
+        
+        total_count = audit_logger.total_count()
         
         filtered_logs = audit_logger.get_logs(
             limit=limit,
@@ -39,7 +43,7 @@ async def get_logs(
             success_only=success_only
         )
         
-        query_time = (time.time() - start_time) * 1000
+        query_time = elapsed_ms(t0)
         
         response = LogsResponse(
             logs=filtered_logs,
@@ -48,43 +52,45 @@ async def get_logs(
             query_time_ms=round(query_time, 2)
         )
         
-        audit_logger.log_operation(
-            operation="get_logs",
-            endpoint="/logs",
-            parameters={
-                "limit": limit,
-                "operation": operation,
-                "success_only": success_only
-            },
-            success=True,
-            execution_time_ms=query_time,
-            result_summary={
-                "logs_returned": len(filtered_logs),
-                "total_logs": total_count
-            }
-        )
+        if audit_logger.should_log(success=True):
+            audit_queue.enqueue({
+                "operation": "get_logs",
+                "endpoint": "/logs",
+                "parameters": {
+                    "limit": limit,
+                    "operation": operation,
+                    "success_only": success_only
+                },
+                "success": True,
+                "execution_time_ms": query_time,
+                "result_summary": {
+                    "logs_returned": len(filtered_logs),
+                    "total_logs": total_count
+                }
+            })
         
-        logger.info(f"Logs query completed in {query_time:.2f}ms, returned {len(filtered_logs)} logs")
+        logger.info("Logs query completed in %.2fms, returned %d logs", query_time, len(filtered_logs))
         
         return response
         
     except Exception as e:
-        query_time = (time.time() - start_time) * 1000
+        query_time = elapsed_ms(t0)
         error_msg = f"Failed to retrieve logs: {str(e)}"
         
-        audit_logger.log_operation(
-            operation="get_logs",
-            endpoint="/logs",
-            parameters={
-                "limit": limit,
-                "operation": operation,
-                "success_only": success_only
-            },
-            success=False,
-            execution_time_ms=query_time,
-            result_summary={},
-            error_message=error_msg
-        )
+        if audit_logger.should_log(success=False):
+            audit_queue.enqueue({
+                "operation": "get_logs",
+                "endpoint": "/logs",
+                "parameters": {
+                    "limit": limit,
+                    "operation": operation,
+                    "success_only": success_only
+                },
+                "success": False,
+                "execution_time_ms": query_time,
+                "result_summary": {},
+                "error_message": error_msg
+            })
         
         logger.error(error_msg)
         raise
@@ -92,46 +98,50 @@ async def get_logs(
 
 @router.get("/stats", response_model=StatsResponse)
 async def get_log_stats():
-    start_time = time.time()
+    t0 = time.perf_counter_ns()
     
     try:
+        audit_queue.flush()
+        
         stats = audit_logger.get_stats()
-        query_time = (time.time() - start_time) * 1000
+        query_time = elapsed_ms(t0)
         
         response = StatsResponse(
             stats=stats,
             query_time_ms=round(query_time, 2)
         )
         
-        audit_logger.log_operation(
-            operation="get_log_stats",
-            endpoint="/logs/stats",
-            parameters={},
-            success=True,
-            execution_time_ms=query_time,
-            result_summary={
-                "total_operations": stats.get("total_operations", 0),
-                "success_rate": stats.get("success_rate", 0)
-            }
-        )
+        if audit_logger.should_log(success=True):
+            audit_queue.enqueue({
+                "operation": "get_log_stats",
+                "endpoint": "/logs/stats",
+                "parameters": {},
+                "success": True,
+                "execution_time_ms": query_time,
+                "result_summary": {
+                    "total_operations": stats.get("total_operations", 0),
+                    "success_rate": stats.get("success_rate", 0)
+                }
+            })
         
-        logger.info(f"Log stats query completed in {query_time:.2f}ms")
+        logger.info("Log stats query completed in %.2fms", query_time)
         
         return response
         
     except Exception as e:
-        query_time = (time.time() - start_time) * 1000
+        query_time = elapsed_ms(t0)
         error_msg = f"Failed to retrieve log stats: {str(e)}"
         
-        audit_logger.log_operation(
-            operation="get_log_stats",
-            endpoint="/logs/stats",
-            parameters={},
-            success=False,
-            execution_time_ms=query_time,
-            result_summary={},
-            error_message=error_msg
-        )
+        if audit_logger.should_log(success=False):
+            audit_queue.enqueue({
+                "operation": "get_log_stats",
+                "endpoint": "/logs/stats",
+                "parameters": {},
+                "success": False,
+                "execution_time_ms": query_time,
+                "result_summary": {},
+                "error_message": error_msg
+            })
         
         logger.error(error_msg)
         raise
@@ -139,26 +149,29 @@ async def get_log_stats():
 
 @router.delete("/clear")
 async def clear_logs():
-    start_time = time.time()
+    t0 = time.perf_counter_ns()
     
     try:
-        logs_before = len(audit_logger.get_logs())
+        audit_queue.flush()
+        
+        logs_before = audit_logger.total_count()
         audit_logger.clear_logs()
         
-        query_time = (time.time() - start_time) * 1000
-        
-        audit_logger.log_operation(
-            operation="clear_logs",
-            endpoint="/logs/clear",
-            parameters={},
-            success=True,
-            execution_time_ms=query_time,
-            result_summary={
-                "logs_cleared": logs_before
-            }
-        )
+        query_time = elapsed_ms(t0)
         
-        logger.info(f"Cleared {logs_before} logs in {query_time:.2f}ms")
+        if audit_logger.should_log(success=True):
+            audit_queue.enqueue({
+                "operation": "clear_logs",
+                "endpoint": "/logs/clear",
+                "parameters": {},
+                "success": True,
+                "execution_time_ms": query_time,
+                "result_summary": {
+                    "logs_cleared": logs_before
+                }
+            })
+        
+        logger.info("Cleared %d logs in %.2fms", logs_before, query_time)
         
         return {
             "success": True,
@@ -167,18 +180,19 @@ async def clear_logs():
         }
         
     except Exception as e:
-        query_time = (time.time() - start_time) * 1000
+        query_time = elapsed_ms(t0)
         error_msg = f"Failed to clear logs: {str(e)}"
         
-        audit_logger.log_operation(
-            operation="clear_logs",
-            endpoint="/logs/clear",
-            parameters={},
-            success=False,
-            execution_time_ms=query_time,
-            result_summary={},
-            error_message=error_msg
-        )
+        if audit_logger.should_log(success=False):
+            audit_queue.enqueue({
+                "operation": "clear_logs",
+                "endpoint": "/logs/clear",
+                "parameters": {},
+                "success": False,
+                "execution_time_ms": query_time,
+                "result_summary": {},
+                "error_message": error_msg
+            })
         
         logger.error(error_msg)
         raise
@@ -187,14 +201,12 @@ async def clear_logs():
 @router.get("/operations")
 async def get_available_operations():
     try:
-        logs = audit_logger.get_logs()
-        operations = set()
+        audit_queue.flush()
         
-        for log in logs:
-            operations.add(log.get("operation", "unknown"))
+        operations = audit_logger.get_operations()
         
         return {
-            "available_operations": sorted(list(operations)),
+            "available_operations": sorted(operations),
             "total_unique_operations": len(operations),
             "description": "List of all operation types that have been logged"
         }
@@ -205,44 +217,51 @@ async def get_available_operations():
         raise
 
 
+_LOGGING_FEATURES = (
+    "Operation tracking",
+    "Performance monitoring", 
+    "Error logging",
+    "Parameter sanitization",
+    "Statistical analysis"
+)
+
+_LOGGING_ENDPOINTS = (
+    {
+        "endpoint": "/logs",
+        "method": "GET",
+        "description": "Retrieve audit logs with filtering options"
+    },
+    {
+        "endpoint": "/logs/stats",
+        "method": "GET", 
+        "description": "Get aggregated statistics about operations"
+    },
+    {
+        "endpoint": "/logs/clear",
+        "method": "DELETE",
+        "description": "Clear all audit logs"
+    },
+    {
+        "endpoint": "/logs/operations",
+        "method": "GET",
+        "description": "List all available operation types"
+    }
+)
+
+
 @router.get("/info")
 async def get_logging_info():
     try:
-        stats = audit_logger.get_stats()
+        audit_queue.flush()
         
         return {
             "logging_system": "In-Memory Audit Logger",
             "max_logs": audit_logger.max_logs,
-            "current_log_count": stats.get("total_operations", 0),
-            "features": [
-                "Operation tracking",
-                "Performance monitoring", 
-                "Error logging",
-                "Parameter sanitization",
-                "Statistical analysis"
-            ],
-            "endpoints": [
-                {
-                    "endpoint": "/logs",
-                    "method": "GET",
-                    "description": "Retrieve audit logs with filtering options"
-                },
-                {
-                    "endpoint": "/logs/stats",
-                    "method": "GET", 
-                    "description": "Get aggregated statistics about operations"
-                },
-                {
-                    "endpoint": "/logs/clear",
-                    "method": "DELETE",
-                    "description": "Clear all audit logs"
-                },
-                {
-                    "endpoint": "/logs/operations",
-                    "method": "GET",
-                    "description": "List all available operation types"
-                }
-            ]
+            "enabled": audit_logger.enabled,
+            "sample_rate": audit_logger.sample_rate,
+            "current_log_count": audit_logger.total_count(),
+            "features": _LOGGING_FEATURES,
+            "endpoints": _LOGGING_ENDPOINTS
         }
         
     except Exception as e:
@@ -1,30 +1,48 @@
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
-from typing import Optional, Literal
-import time
+from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Optional, Literal, Tuple
+import orjson
 
 from src.core.manipulators import (
-    reverse_complement_fasta, 
+    reverse_complement_with_summary,
     extract_subsequence, 
-    get_fasta_summary,
     ManipulationError
 )
+from src.core.workers import run_in_pool
 from src.utils.validators import (
-    validate_input_format, 
-    validate_content_size, 
-    validate_fasta_format,
     validate_coordinates,
     validate_sequence_id,
-    ValidationError
+    ValidationError,
+    MAX_BATCH_ITEMS
 )
-from src.utils.logging import audit_logger, logger
+from src.api.dependencies import (
+    SequenceContent,
+    enforce_content_length,
+    json_body,
+    json_body_openapi
+)
+from src.utils.audit import audited
+from src.utils.logging import logger
+from src.utils.streaming import fasta_stream_response
+
 
+router = APIRouter(default_response_class=ORJSONResponse)
 
-router = APIRouter()
+_ERR_MAP = {
+    ValidationError: (400, logger.warning, "Validation error"),
+    ManipulationError: (422, logger.error, "Manipulation error"),
+}
 
 
 class ReverseComplementRequest(BaseModel):
-    content: str = Field(..., description="FASTA file content")
+    model_config = ConfigDict(extra="forbid")
+    
+    content: SequenceContent = Field(
+        ...,
+        description="FASTA file content"
+    )
     input_format: Literal["string", "base64"] = Field(
         default="string", 
         description="Format of input content"
@@ -35,6 +53,9 @@ class ReverseComplementRequest(BaseModel):
     )
 
 
+_reverse_complement_request = json_body(ReverseComplementRequest)
+
+
 class ReverseComplementResponse(BaseModel):
     fasta_content: str
     success: bool = True
@@ -42,8 +63,38 @@ class ReverseComplementResponse(BaseModel):
     execution_time_ms: float
 
 
+class BatchReverseComplementRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    
+    items: List[ReverseComplementRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_ITEMS,
+        description="FASTA inputs to reverse complement"
+    )
+
+
+_batch_reverse_complement_request = json_body(BatchReverseComplementRequest)
+
+
+class BatchReverseComplementItem(BaseModel):
+    fasta_content: str
+    manipulation_summary: Optional[dict] = None
+
+
+class BatchReverseComplementResponse(BaseModel):
+    results: List[BatchReverseComplementItem]
+    success: bool = True
+    execution_time_ms: float
+
+
 class SubsequenceRequest(BaseModel):
-    content: str = Field(..., description="FASTA file content")
+    model_config = ConfigDict(extra="forbid")
+    
+    content: SequenceContent = Field(
+        ...,
+        description="FASTA file content"
+    )
     sequence_id: str = Field(..., description="ID of sequence to extract from")
     start: int = Field(..., ge=0, description="Start position (0-based, inclusive)")
     end: int = Field(..., gt=0, description="End position (0-based, exclusive)")
@@ -53,6 +104,9 @@ class SubsequenceRequest(BaseModel):
     )
 
 
+_subsequence_request = json_body(SubsequenceRequest)
+
+
 class SubsequenceResponse(BaseModel):
     fasta_content: str
     success: bool = True
@@ -60,273 +114,244 @@ class SubsequenceResponse(BaseModel):
     execution_time_ms: float
 
 
-@router.post("/reverse-complement", response_model=ReverseComplementResponse)
-async def reverse_complement(request: ReverseComplementRequest):
-    start_time = time.time()
-    operation = "reverse_complement"
+async def _run_reverse_complement(
+    request: ReverseComplementRequest,
+    endpoint: str,
+    include_summary: bool
+) -> Tuple[str, Optional[dict], float]:
+    params = {
+        "input_format": request.input_format,
+        "include_summary": include_summary,
+        "content_length": len(request.content) if request.content else 0
+    }
     
-    try:
-        validate_input_format(request.input_format)
-        validate_content_size(request.content)
-        
-        if request.input_format == "string":
-            validate_fasta_format(request.content)
-        
-        result = reverse_complement_fasta(
-            request.content, 
-            input_format=request.input_format
+    async with audited("reverse_complement", endpoint, params, _ERR_MAP) as audit:
+        result, manipulation_summary = await run_in_pool(
+            reverse_complement_with_summary,
+            request.content,
+            input_format=request.input_format,
+            validate=request.input_format == "string"
         )
-        
-        manipulation_summary = None
-        if request.include_summary:
-            manipulation_summary = get_fasta_summary(
-                request.content, 
-                input_format=request.input_format
+        if not include_summary:
+            manipulation_summary = None
+        
+        audit.set_result({
+            "output_length": len(result),
+            "manipulation_summary": manipulation_summary
+        })
+        execution_time = audit.elapsed_ms()
+    
+    logger.info("Reverse complement completed in %.2fms", execution_time)
+    
+    return result, manipulation_summary, execution_time
+
+
+@router.post(
+    "/reverse-complement",
+    response_model=ReverseComplementResponse,
+    openapi_extra=json_body_openapi(ReverseComplementRequest),
+    dependencies=[Depends(enforce_content_length)]
+)
+async def reverse_complement(
+    request: ReverseComplementRequest = Depends(_reverse_complement_request)
+):
+    result, manipulation_summary, execution_time = await _run_reverse_complement(
+        request,
+        endpoint="/manipulate/reverse-complement",
+        include_summary=request.include_summary
+    )
+    
+    return ReverseComplementResponse(
+        fasta_content=result,
+        manipulation_summary=manipulation_summary,
+        execution_time_ms=round(execution_time, 2)
+    )
+
+
+@router.post(
+    "/reverse-complement/stream",
+    response_class=StreamingResponse,
+    openapi_extra=json_body_openapi(ReverseComplementRequest),
+    dependencies=[Depends(enforce_content_length)]
+)
+async def reverse_complement_stream(
+    request: ReverseComplementRequest = Depends(_reverse_complement_request)
+):
+    result, _, execution_time = await _run_reverse_complement(
+        request,
+        endpoint="/manipulate/reverse-complement/stream",
+        include_summary=False
+    )
+    
+    return fasta_stream_response(result, execution_time)
+
+
+def _reverse_complement_batch(
+    items: List[ReverseComplementRequest]
+) -> List[BatchReverseComplementItem]:
+    results = []
+    for i, item in enumerate(items):
+        try:
+            result, manipulation_summary = reverse_complement_with_summary(
+                item.content,
+                input_format=item.input_format,
+                validate=item.input_format == "string"
             )
+        except (ValidationError, ManipulationError) as e:
+            raise type(e)(f"item {i}: {str(e)}")
         
-        execution_time = (time.time() - start_time) * 1000
-        
-        response = ReverseComplementResponse(
+        results.append(BatchReverseComplementItem(
             fasta_content=result,
-            manipulation_summary=manipulation_summary,
-            execution_time_ms=round(execution_time, 2)
-        )
-        
-        audit_logger.log_operation(
-            operation=operation,
-            endpoint="/manipulate/reverse-complement",
-            parameters={
-                "input_format": request.input_format,
-                "include_summary": request.include_summary,
-                "content_length": len(request.content)
-            },
-            success=True,
-            execution_time_ms=execution_time,
-            result_summary={
-                "output_length": len(result),
-                "manipulation_summary": manipulation_summary
-            }
-        )
-        
-        logger.info(f"Reverse complement completed in {execution_time:.2f}ms")
-        
-        return response
-        
-    except ValidationError as e:
-        execution_time = (time.time() - start_time) * 1000
-        error_msg = f"Validation error: {str(e)}"
-        
-        audit_logger.log_operation(
-            operation=operation,
-            endpoint="/manipulate/reverse-complement",
-            parameters={
-                "input_format": request.input_format,
-                "include_summary": request.include_summary,
-                "content_length": len(request.content) if request.content else 0
-            },
-            success=False,
-            execution_time_ms=execution_time,
-            result_summary={},
-            error_message=error_msg
-        )
-        
-        logger.warning(error_msg)
-        raise HTTPException(status_code=400, detail=error_msg)
-        
-    except ManipulationError as e:
-        execution_time = (time.time() - start_time) * 1000
-        error_msg = f"Manipulation error: {str(e)}"
-        
-        audit_logger.log_operation(
-            operation=operation,
-            endpoint="/manipulate/reverse-complement",
-            parameters={
-                "input_format": request.input_format,
-                "include_summary": request.include_summary,
-                "content_length": len(request.content) if request.content else 0
-            },
-            success=False,
-            execution_time_ms=execution_time,
-            result_summary={},
-            error_message=error_msg
-        )
-        
-        logger.error(error_msg)
-        raise HTTPException(status_code=422, detail=error_msg)
-        
-    except Exception as e:
-        execution_time = (time.time() - start_time) * 1000
-        error_msg = f"Unexpected error: {str(e)}"
-        
-        audit_logger.log_operation(
-            operation=operation,
-            endpoint="/manipulate/reverse-complement",
-            parameters={
-                "input_format": request.input_format,
-                "include_summary": request.include_summary,
-                "content_length": len(request.content) if request.content else 0
-            },
-            success=False,
-            execution_time_ms=execution_time,
-            result_summary={},
-            error_message=error_msg
-        )
-        
-        logger.error(error_msg)
-        raise HTTPException(status_code=500, detail="Internal server error")
+            manipulation_summary=manipulation_summary if item.include_summary else None
+        ))
+    return results
 
 
-@router.post("/extract-subsequence", response_model=SubsequenceResponse)
-async def extract_subsequence_endpoint(request: SubsequenceRequest):
-    start_time = time.time()
-    operation = "extract_subsequence"
+@router.post(
+    "/reverse-complement/batch",
+    response_model=BatchReverseComplementResponse,
+    openapi_extra=json_body_openapi(BatchReverseComplementRequest),
+    dependencies=[Depends(enforce_content_length)]
+)
+async def reverse_complement_batch(
+    request: BatchReverseComplementRequest = Depends(_batch_reverse_complement_request)
+):
+    params = {
+        "items": len(request.items),
+        "content_length": sum(len(item.content) for item in request.items)
+    }
+    
+    async with audited("reverse_complement_batch", "/manipulate/reverse-complement/batch", params, _ERR_MAP) as audit:
+        results = await run_in_pool(_reverse_complement_batch, request.items)
+        
+        audit.set_result({
+            "n": len(results),
+            "total_output": sum(len(r.fasta_content) for r in results)
+        })
+        execution_time = audit.elapsed_ms()
+    
+    logger.info("Reverse complement batch of %d completed in %.2fms", len(results), execution_time)
     
-    try:
-        validate_input_format(request.input_format)
-        validate_content_size(request.content)
+    return BatchReverseComplementResponse(
+        results=results,
+        execution_time_ms=round(execution_time, 2)
+    )
+
+
+async def _run_extract_subsequence(
+    request: SubsequenceRequest,
+    endpoint: str
+) -> Tuple[str, float]:
+    params = {
+        "input_format": request.input_format,
+        "sequence_id": request.sequence_id,
+        "start": request.start,
+        "end": request.end,
+        "content_length": len(request.content) if request.content else 0
+    }
+    
+    async with audited("extract_subsequence", endpoint, params, _ERR_MAP) as audit:
         validate_sequence_id(request.sequence_id)
         validate_coordinates(request.start, request.end)
         
-        if request.input_format == "string":
-            validate_fasta_format(request.content)
-        
-        result = extract_subsequence(
+        result = await run_in_threadpool(
+            extract_subsequence,
             request.content,
             request.sequence_id,
             request.start,
             request.end,
-            input_format=request.input_format
+            input_format=request.input_format,
+            validate=request.input_format == "string"
         )
         
-        execution_time = (time.time() - start_time) * 1000
-        
-        subsequence_info = {
-            "sequence_id": request.sequence_id,
-            "start": request.start,
-            "end": request.end,
-            "length": request.end - request.start
+        audit.set_result({
+            "output_length": len(result),
+            "subsequence_length": request.end - request.start
+        })
+        execution_time = audit.elapsed_ms()
+    
+    logger.info("Subsequence extraction completed in %.2fms", execution_time)
+    
+    return result, execution_time
+
+
+@router.post(
+    "/extract-subsequence",
+    response_model=SubsequenceResponse,
+    openapi_extra=json_body_openapi(SubsequenceRequest),
+    dependencies=[Depends(enforce_content_length)]
+)
+async def extract_subsequence_endpoint(
+    request: SubsequenceRequest = Depends(_subsequence_request)
+):
+    result, execution_time = await _run_extract_subsequence(
+        request,
+        endpoint="/manipulate/extract-subsequence"
+    )
+    
+    subsequence_info = {
+        "sequence_id": request.sequence_id,
+        "start": request.start,
+        "end": request.end,
+        "length": request.end - request.start
+    }
+    
+    return SubsequenceResponse(
+        fasta_content=result,
+        subsequence_info=subsequence_info,
+        execution_time_ms=round(execution_time, 2)
+    )
+
+
+@router.post(
+    "/extract-subsequence/stream",
+    response_class=StreamingResponse,
+    openapi_extra=json_body_openapi(SubsequenceRequest),
+    dependencies=[Depends(enforce_content_length)]
+)
+async def extract_subsequence_stream(
+    request: SubsequenceRequest = Depends(_subsequence_request)
+):
+    result, execution_time = await _run_extract_subsequence(
+        request,
+        endpoint="/manipulate/extract-subsequence/stream"
+    )
+    
+    return fasta_stream_response(result, execution_time)
+
+
+_OPERATIONS_BYTES = orjson.dumps({
+    "supported_operations": [
+        {
+            "operation": "reverse-complement",
+            "endpoint": "/manipulate/reverse-complement",
+            "stream_endpoint": "/manipulate/reverse-complement/stream",
+            "batch_endpoint": "/manipulate/reverse-complement/batch",
+            "description": "Generate reverse complement of all sequences in FASTA file",
+            "input_format": "FASTA"
+        },
+        {
+            "operation": "extract-subsequence",
+            "endpoint": "/manipulate/extract-subsequence",
+            "stream_endpoint": "/manipulate/extract-subsequence/stream",
+            "description": "Extract subsequence by coordinates from a specific sequence",
+            "input_format": "FASTA"
         }
-        
-        response = SubsequenceResponse(
-            fasta_content=result,
-            subsequence_info=subsequence_info,
-            execution_time_ms=round(execution_time, 2)
-        )
-        
-        audit_logger.log_operation(
-            operation=operation,
-            endpoint="/manipulate/extract-subsequence",
-            parameters={
-                "input_format": request.input_format,
-                "sequence_id": request.sequence_id,
-                "start": request.start,
-                "end": request.end,
-                "content_length": len(request.content)
-            },
-            success=True,
-            execution_time_ms=execution_time,
-            result_summary={
-                "output_length": len(result),
-                "subsequence_length": request.end - request.start
-            }
-        )
-        
-        logger.info(f"Subsequence extraction completed in {execution_time:.2f}ms")
-        
-        return response
-        
-    except ValidationError as e:
-        execution_time = (time.time() - start_time) * 1000
-        error_msg = f"Validation error: {str(e)}"
-        
-        audit_logger.log_operation(
-            operation=operation,
-            endpoint="/manipulate/extract-subsequence",
-            parameters={
-                "input_format": request.input_format,
-                "sequence_id": request.sequence_id,
-                "start": request.start,
-                "end": request.end,
-                "content_length": len(request.content) if request.content else 0
-            },
-            success=False,
-            execution_time_ms=execution_time,
-            result_summary={},
-            error_message=error_msg
-        )
-        
-        logger.warning(error_msg)
-        raise HTTPException(status_code=400, detail=error_msg)
-        
-    except ManipulationError as e:
-        execution_time = (time.time() - start_time) * 1000
-        error_msg = f"Manipulation error: {str(e)}"
-        
-        audit_logger.log_operation(
-            operation=operation,
-            endpoint="/manipulate/extract-subsequence",
-            parameters={
-                "input_format": request.input_format,
-                "sequence_id": request.sequence_id,
-                "start": request.start,
-                "end": request.end,
-                "content_length": len(request.content) if request.content else 0
-            },
-            success=False,
-            execution_time_ms=execution_time,
-            result_summary={},
-            error_message=error_msg
-        )
-        
-        logger.error(error_msg)
-        raise HTTPException(status_code=422, detail=error_msg)
-        
-    except Exception as e:
-        execution_time = (time.time() - start_time) * 1000
-        error_msg = f"Unexpected error: {str(e)}"
-        
-        audit_logger.log_operation(
-            operation=operation,
-            endpoint="/manipulate/extract-subsequence",
-            parameters={
-                "input_format": request.input_format,
-                "sequence_id": request.sequence_id,
-                "start": request.start,
-                "end": request.end,
-                "content_length": len(request.content) if request.content else 0
-            },
-            success=False,
-            execution_time_ms=execution_time,
-            result_summary={},
-            error_message=error_msg
-        )
-        
-        logger.error(error_msg)
-        raise HTTPException(status_code=500, detail="Internal server error")
+    ],
+    "input_formats": ["string", "base64"],
+    "features": [
+        "Manipulation summary statistics",
+        "Multiple sequence support",
+        "Coordinate-based extraction",
+        "Error handling and validation"
+    ]
+})
 
 
 @router.get("/operations")
 async def get_supported_operations():
-    return {
-        "supported_operations": [
-            {
-                "operation": "reverse-complement",
-                "endpoint": "/manipulate/reverse-complement",
-                "description": "Generate reverse complement of all sequences in FASTA file",
-                "input_format": "FASTA"
-            },
-            {
-                "operation": "extract-subsequence",
-                "endpoint": "/manipulate/extract-subsequence",
-                "description": "Extract subsequence by coordinates from a specific sequence",
-                "input_format": "FASTA"
-            }
-        ],
-        "input_formats": ["string", "base64"],
-        "features": [
-            "Manipulation summary statistics",
-            "Multiple sequence support",
-            "Coordinate-based extraction",
-            "Error handling and validation"
-        ]
-    }
\ No newline at end of file
+    return Response(
+        _OPERATIONS_BYTES,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=3600"}
+    )
@@ -1,30 +1,95 @@
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
-from typing import Optional, Literal, List, Any, Dict
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field, ValidationError as PydanticValidationError
+from typing import Optional, Literal, List, Any, AsyncIterator, Dict, Tuple
+from collections import OrderedDict
+import asyncio
 import time
+import uuid
+import orjson
 
 from src.core.seqkit_wrapper import (
+    run_seqkit_command_async, 
     run_seqkit_stats, 
-    run_seqkit_command, 
-    validate_seqkit_installation,
-    get_seqkit_version,
+    run_seqkit_stats_stream, 
+    get_seqkit_status,
     SeqkitError
 )
+from src.core.stats_batcher import run_seqkit_stats_batched
+from src.core.workers import run_in_pool
 from src.utils.validators import (
-    validate_input_format, 
     validate_content_size, 
     validate_fastq_format,
-    validate_output_format,
-    ValidationError
+    fastq_format_quick_check,
+    ValidationError,
+    MAX_BATCH_ITEMS,
+    MAX_RAW_BODY_LENGTH,
+    MAX_REQUEST_LENGTH
 )
+from src.api.dependencies import (
+    SequenceContent,
+    content_length_limit,
+    enforce_content_length,
+    json_body,
+    json_body_openapi
+)
+from src.utils.audit import audited
 from src.utils.logging import audit_logger, logger
+from src.utils import audit_queue
+from src.utils.timing import elapsed_ms
 
 
 router = APIRouter()
 
+_ERR_MAP = {
+    ValidationError: (400, logger.warning, "Validation error"),
+    SeqkitError: (422, logger.error, "seqkit error"),
+}
+
+SUPPORTED_COMMANDS = [
+    "stats", "head", "tail", "sample", "seq", "subseq", 
+    "grep", "locate", "rmdup", "common", "split", "sort",
+    "shuffle", "sliding", "range", "restart", "concat",
+    "tab2fx", "fx2tab", "translate", "watch"
+]
+ALLOWED_COMMANDS = frozenset(SUPPORTED_COMMANDS)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+MAX_TRACKED_BATCH_JOBS = 100
+
+# Progress of recent /seqkit/batches jobs, oldest first
+_batch_jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+_INFO_BASE = {
+    "supported_commands": SUPPORTED_COMMANDS,
+    "endpoints": [
+        {
+            "endpoint": "/seqkit/stats",
+            "description": "Generate FASTQ statistics using seqkit stats"
+        },
+        {
+            "endpoint": "/seqkit/stats/raw",
+            "description": "Generate FASTQ statistics from a raw request body"
+        },
+        {
+            "endpoint": "/seqkit/command",
+            "description": "Run custom seqkit commands"
+        },
+        {
+            "endpoint": "/seqkit/batches",
+            "description": "Run seqkit stats over a JSON Lines batch of requests"
+        }
+    ]
+}
+
 
 class SeqkitStatsRequest(BaseModel):
-    content: str = Field(..., description="FASTQ file content")
+    model_config = ConfigDict(extra="forbid")
+    
+    content: SequenceContent = Field(
+        ...,
+        description="FASTQ file content"
+    )
     input_format: Literal["string", "base64"] = Field(
         default="string", 
         description="Format of input content"
@@ -35,6 +100,9 @@ class SeqkitStatsRequest(BaseModel):
     )
 
 
+_stats_request = json_body(SeqkitStatsRequest)
+
+
 class SeqkitStatsResponse(BaseModel):
     statistics: Dict[str, Any]
     success: bool = True
@@ -42,7 +110,12 @@ class SeqkitStatsResponse(BaseModel):
 
 
 class SeqkitCommandRequest(BaseModel):
-    content: str = Field(..., description="FASTQ file content")
+    model_config = ConfigDict(extra="forbid")
+    
+    content: SequenceContent = Field(
+        ...,
+        description="FASTQ file content"
+    )
     command: str = Field(..., description="seqkit command to run")
     args: Optional[List[str]] = Field(default=None, description="Additional command arguments")
     input_format: Literal["string", "base64"] = Field(
@@ -51,280 +124,400 @@ class SeqkitCommandRequest(BaseModel):
     )
 
 
+_command_request = json_body(SeqkitCommandRequest)
+
+
 class SeqkitCommandResponse(BaseModel):
     output: str
     success: bool = True
     execution_time_ms: float
 
 
-@router.post("/stats", response_model=SeqkitStatsResponse)
-async def get_fastq_stats(request: SeqkitStatsRequest):
-    start_time = time.time()
-    operation = "seqkit_stats"
+@router.post(
+    "/stats",
+    response_model=SeqkitStatsResponse,
+    openapi_extra=json_body_openapi(SeqkitStatsRequest),
+    dependencies=[Depends(enforce_content_length)]
+)
+async def get_fastq_stats(request: SeqkitStatsRequest = Depends(_stats_request)):
+    params = {
+        "input_format": request.input_format,
+        "output_format": request.output_format,
+        "content_length": len(request.content) if request.content else 0
+    }
     
-    try:
-        if not validate_seqkit_installation():
+    async with audited("seqkit_stats", "/seqkit/stats", params, _ERR_MAP) as audit:
+        seqkit_available, _ = get_seqkit_status()
+        if not seqkit_available:
             raise HTTPException(
                 status_code=503, 
                 detail="seqkit is not available on this server"
             )
         
-        validate_input_format(request.input_format)
-        validate_output_format(request.output_format)
         validate_content_size(request.content)
         
-        if request.input_format == "string":
+        if request.input_format == "string" and not fastq_format_quick_check(request.content):
             validate_fastq_format(request.content)
         
-        stats_result = run_seqkit_stats(
+        stats_result, cache_hit = await run_seqkit_stats_batched(
             request.content,
             input_format=request.input_format,
             output_format=request.output_format
         )
         
-        execution_time = (time.time() - start_time) * 1000
-        
-        response = SeqkitStatsResponse(
-            statistics=stats_result,
-            execution_time_ms=round(execution_time, 2)
-        )
-        
-        audit_logger.log_operation(
-            operation=operation,
-            endpoint="/seqkit/stats",
-            parameters={
-                "input_format": request.input_format,
-                "output_format": request.output_format,
-                "content_length": len(request.content)
-            },
-            success=True,
-            execution_time_ms=execution_time,
-            result_summary={
-                "statistics_generated": True,
-                "output_format": request.output_format
+        audit.set_result({
+            "statistics_generated": True,
+            "output_format": request.output_format,
+            "cache_hit": cache_hit
+        })
+        execution_time = audit.elapsed_ms()
+    
+    logger.info("seqkit stats completed in %.2fms", execution_time)
+    
+    return SeqkitStatsResponse(
+        statistics=stats_result,
+        execution_time_ms=round(execution_time, 2)
+    )
+
+
+async def _limited_stream(request: Request, max_length: int) -> AsyncIterator[bytes]:
+    received = 0
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > max_length:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Request body exceeds maximum allowed size ({max_length} bytes)"
+            )
+        if chunk:
+            yield chunk
+
+
+@router.post(
+    "/stats/raw",
+    response_model=SeqkitStatsResponse,
+    dependencies=[Depends(content_length_limit(MAX_RAW_BODY_LENGTH))],
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/octet-stream": {"schema": {"type": "string", "format": "binary"}}
             }
-        )
-        
-        logger.info(f"seqkit stats completed in {execution_time:.2f}ms")
-        
-        return response
-        
-    except ValidationError as e:
-        execution_time = (time.time() - start_time) * 1000
-        error_msg = f"Validation error: {str(e)}"
-        
-        audit_logger.log_operation(
-            operation=operation,
-            endpoint="/seqkit/stats",
-            parameters={
-                "input_format": request.input_format,
-                "output_format": request.output_format,
-                "content_length": len(request.content) if request.content else 0
-            },
-            success=False,
-            execution_time_ms=execution_time,
-            result_summary={},
-            error_message=error_msg
-        )
-        
-        logger.warning(error_msg)
-        raise HTTPException(status_code=400, detail=error_msg)
-        
-    except SeqkitError as e:
-        execution_time = (time.time() - start_time) * 1000
-        error_msg = f"seqkit error: {str(e)}"
-        
-        audit_logger.log_operation(
-            operation=operation,
-            endpoint="/seqkit/stats",
-            parameters={
-                "input_format": request.input_format,
-                "output_format": request.output_format,
-                "content_length": len(request.content) if request.content else 0
-            },
-            success=False,
-            execution_time_ms=execution_time,
-            result_summary={},
-            error_message=error_msg
-        )
-        
-        logger.error(error_msg)
-        raise HTTPException(status_code=422, detail=error_msg)
-        
-    except Exception as e:
-        execution_time = (time.time() - start_time) * 1000
-        error_msg = f"Unexpected error: {str(e)}"
+        }
+    }
+)
+async def get_fastq_stats_raw(
+    request: Request,
+    input_format: Literal["string", "base64"] = Header(
+        default="string",
+        alias="X-Input-Format",
+        description="Encoding of the request body"
+    ),
+    output_format: Literal["json", "text"] = Query(
+        default="json",
+        description="Format of output statistics"
+    )
+):
+    """
+    ``seqkit stats`` on a FASTQ request body sent as-is, without JSON framing.
+
+    The body is streamed into seqkit's stdin as it arrives (up to
+    ``MAX_RAW_BODY_LENGTH`` bytes), so it is never held in memory whole.
+    Format checks are left to seqkit.
+    """
+    params = {
+        "input_format": input_format,
+        "output_format": output_format,
+        "content_length": request.headers.get("content-length")
+    }
+    
+    async with audited("seqkit_stats", "/seqkit/stats/raw", params, _ERR_MAP) as audit:
+        seqkit_available, _ = get_seqkit_status()
+        if not seqkit_available:
+            raise HTTPException(
+                status_code=503, 
+                detail="seqkit is not available on this server"
+            )
         
-        audit_logger.log_operation(
-            operation=operation,
-            endpoint="/seqkit/stats",
-            parameters={
-                "input_format": request.input_format,
-                "output_format": request.output_format,
-                "content_length": len(request.content) if request.content else 0
-            },
-            success=False,
-            execution_time_ms=execution_time,
-            result_summary={},
-            error_message=error_msg
+        stats_result = await run_seqkit_stats_stream(
+            _limited_stream(request, MAX_RAW_BODY_LENGTH),
+            input_format=input_format,
+            output_format=output_format
         )
         
-        logger.error(error_msg)
-        raise HTTPException(status_code=500, detail="Internal server error")
+        audit.set_result({
+            "statistics_generated": True,
+            "output_format": output_format
+        })
+        execution_time = audit.elapsed_ms()
+    
+    logger.info("seqkit stats (raw body) completed in %.2fms", execution_time)
+    
+    return SeqkitStatsResponse(
+        statistics=stats_result,
+        execution_time_ms=round(execution_time, 2)
+    )
 
 
-@router.post("/command", response_model=SeqkitCommandResponse)
-async def run_seqkit_command_endpoint(request: SeqkitCommandRequest):
-    start_time = time.time()
-    operation = f"seqkit_{request.command}"
+@router.post(
+    "/command",
+    response_model=SeqkitCommandResponse,
+    openapi_extra=json_body_openapi(SeqkitCommandRequest),
+    dependencies=[Depends(enforce_content_length)]
+)
+async def run_seqkit_command_endpoint(
+    request: SeqkitCommandRequest = Depends(_command_request)
+):
+    params = {
+        "command": request.command,
+        "args": request.args,
+        "input_format": request.input_format,
+        "content_length": len(request.content) if request.content else 0
+    }
     
-    try:
-        if not validate_seqkit_installation():
+    async with audited(f"seqkit_{request.command}", "/seqkit/command", params, _ERR_MAP) as audit:
+        seqkit_available, _ = get_seqkit_status()
+        if not seqkit_available:
             raise HTTPException(
                 status_code=503, 
                 detail="seqkit is not available on this server"
             )
         
-        validate_input_format(request.input_format)
         validate_content_size(request.content)
         
-        if request.input_format == "string":
+        if request.input_format == "string" and not fastq_format_quick_check(request.content):
             validate_fastq_format(request.content)
         
-        allowed_commands = [
-            "stats", "head", "tail", "sample", "seq", "subseq", 
-            "grep", "locate", "rmdup", "common", "split", "sort",
-            "shuffle", "sliding", "range", "restart", "concat",
-            "tab2fx", "fx2tab", "translate", "watch"
-        ]
+        if request.command not in ALLOWED_COMMANDS:
+            raise ValidationError(f"Command '{request.command}' not allowed. Allowed commands: {SUPPORTED_COMMANDS}")
         
-        if request.command not in allowed_commands:
-            raise ValidationError(f"Command '{request.command}' not allowed. Allowed commands: {allowed_commands}")
-        
-        result = run_seqkit_command(
+        result = await run_seqkit_command_async(
             request.content,
             request.command,
             args=request.args or [],
             input_format=request.input_format
         )
         
-        execution_time = (time.time() - start_time) * 1000
-        
-        response = SeqkitCommandResponse(
-            output=result,
-            execution_time_ms=round(execution_time, 2)
-        )
-        
-        audit_logger.log_operation(
-            operation=operation,
-            endpoint="/seqkit/command",
-            parameters={
-                "command": request.command,
-                "args": request.args,
-                "input_format": request.input_format,
-                "content_length": len(request.content)
-            },
-            success=True,
-            execution_time_ms=execution_time,
-            result_summary={
-                "output_length": len(result),
-                "command": request.command
-            }
-        )
-        
-        logger.info(f"seqkit {request.command} completed in {execution_time:.2f}ms")
-        
-        return response
-        
-    except ValidationError as e:
-        execution_time = (time.time() - start_time) * 1000
-        error_msg = f"Validation error: {str(e)}"
-        
-        audit_logger.log_operation(
-            operation=operation,
-            endpoint="/seqkit/command",
-            parameters={
-                "command": request.command,
-                "args": request.args,
-                "input_format": request.input_format,
-                "content_length": len(request.content) if request.content else 0
-            },
-            success=False,
-            execution_time_ms=execution_time,
-            result_summary={},
-            error_message=error_msg
-        )
-        
-        logger.warning(error_msg)
-        raise HTTPException(status_code=400, detail=error_msg)
-        
-    except SeqkitError as e:
-        execution_time = (time.time() - start_time) * 1000
-        error_msg = f"seqkit error: {str(e)}"
+        audit.set_result({
+            "output_length": len(result),
+            "command": request.command
+        })
+        execution_time = audit.elapsed_ms()
+    
+    logger.info("seqkit %s completed in %.2fms", request.command, execution_time)
+    
+    return SeqkitCommandResponse(
+        output=result,
+        execution_time_ms=round(execution_time, 2)
+    )
+
+
+def _track_batch_job() -> Tuple[str, Dict[str, Any]]:
+    job_id = uuid.uuid4().hex
+    job = {
+        "job_id": job_id,
+        "status": "running",
+        "total": 0,
+        "completed": 0,
+        "failed": 0,
+        "started_at": time.time(),
+        "finished_at": None
+    }
+    
+    _batch_jobs[job_id] = job
+    while len(_batch_jobs) > MAX_TRACKED_BATCH_JOBS:
+        _batch_jobs.popitem(last=False)
+    
+    return job_id, job
+
+
+async def _iter_lines(request: Request, max_length: int) -> AsyncIterator[bytes]:
+    """
+    Split the request body into lines as it streams in.
+
+    A line longer than ``max_length`` bytes is a 413. This also bounds bodies
+    sent without a Content-Length header, which ``enforce_content_length``
+    cannot check up front.
+    """
+    parts = []
+    length = 0
+    async for chunk in request.stream():
+        start = 0
+        while (end := chunk.find(b"\n", start)) >= 0:
+            if length + end - start > max_length:
+                raise _line_too_long(max_length)
+            parts.append(chunk[start:end])
+            yield b"".join(parts)
+            parts = []
+            length = 0
+            start = end + 1
+        
+        length += len(chunk) - start
+        if length > max_length:
+            raise _line_too_long(max_length)
+        parts.append(chunk[start:])
+    
+    if parts:
+        yield b"".join(parts)
+
+
+def _line_too_long(max_length: int) -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail=f"Batch line exceeds maximum allowed size ({max_length} bytes)"
+    )
+
+
+async def _batch_stats_item(index: int, item: SeqkitStatsRequest) -> Dict[str, Any]:
+    t0 = time.perf_counter_ns()
+    
+    try:
+        validate_content_size(item.content)
+        if item.input_format == "string" and not fastq_format_quick_check(item.content):
+            validate_fastq_format(item.content)
         
-        audit_logger.log_operation(
-            operation=operation,
-            endpoint="/seqkit/command",
-            parameters={
-                "command": request.command,
-                "args": request.args,
-                "input_format": request.input_format,
-                "content_length": len(request.content) if request.content else 0
-            },
-            success=False,
-            execution_time_ms=execution_time,
-            result_summary={},
-            error_message=error_msg
+        stats_result = await run_in_pool(
+            run_seqkit_stats, item.content, item.input_format, item.output_format
         )
-        
-        logger.error(error_msg)
-        raise HTTPException(status_code=422, detail=error_msg)
-        
+    except (ValidationError, SeqkitError) as e:
+        return {"index": index, "success": False, "error": str(e)}
     except Exception as e:
-        execution_time = (time.time() - start_time) * 1000
-        error_msg = f"Unexpected error: {str(e)}"
-        
-        audit_logger.log_operation(
-            operation=operation,
-            endpoint="/seqkit/command",
-            parameters={
-                "command": request.command,
-                "args": request.args,
-                "input_format": request.input_format,
-                "content_length": len(request.content) if request.content else 0
-            },
-            success=False,
-            execution_time_ms=execution_time,
-            result_summary={},
-            error_message=error_msg
+        logger.error("seqkit batch item %d failed: %s", index, e)
+        return {"index": index, "success": False, "error": "Internal server error"}
+    
+    return {
+        "index": index,
+        "success": True,
+        "statistics": stats_result,
+        "execution_time_ms": round(elapsed_ms(t0), 2)
+    }
+
+
+def _invalid_batch_line(index: int, e: PydanticValidationError) -> asyncio.Future:
+    errors = "; ".join(
+        ": ".join(filter(None, (".".join(str(loc) for loc in error["loc"]), error["msg"])))
+        for error in e.errors()
+    )
+    future = asyncio.get_running_loop().create_future()
+    future.set_result({"index": index, "success": False, "error": f"Invalid request: {errors}"})
+    return future
+
+
+@router.post(
+    "/batches",
+    response_class=StreamingResponse,
+    dependencies=[Depends(enforce_content_length)]
+)
+async def run_seqkit_stats_batches(request: Request):
+    """
+    Run ``seqkit stats`` for every line of a JSON Lines body.
+
+    Each non-empty line is a ``SeqkitStatsRequest``. Items start running in
+    the worker process pool as their lines arrive, and results stream back as
+    JSON Lines in completion order, each tagged with its line's ``index``.
+    Progress can be polled at ``/seqkit/batches/{job_id}`` using the
+    ``X-Batch-Job-Id`` response header.
+    """
+    seqkit_available, _ = get_seqkit_status()
+    if not seqkit_available:
+        raise HTTPException(
+            status_code=503, 
+            detail="seqkit is not available on this server"
         )
-        
-        logger.error(error_msg)
-        raise HTTPException(status_code=500, detail="Internal server error")
+    
+    t0 = time.perf_counter_ns()
+    job_id, job = _track_batch_job()
+    tasks = []
+    
+    try:
+        async for line in _iter_lines(request, MAX_REQUEST_LENGTH):
+            if not line.strip():
+                continue
+            
+            index = len(tasks)
+            if index >= MAX_BATCH_ITEMS:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"Batch exceeds maximum of {MAX_BATCH_ITEMS} items"
+                )
+            
+            try:
+                item = SeqkitStatsRequest.model_validate_json(line)
+            except PydanticValidationError as e:
+                tasks.append(_invalid_batch_line(index, e))
+                continue
+            
+            tasks.append(asyncio.create_task(_batch_stats_item(index, item)))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        job["status"] = "failed"
+        job["finished_at"] = time.time()
+        raise
+    
+    job["total"] = len(tasks)
+    
+    async def results() -> AsyncIterator[bytes]:
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                result = await next_result
+                job["completed"] += 1
+                if not result["success"]:
+                    job["failed"] += 1
+                yield orjson.dumps(result) + b"\n"
+        finally:
+            for task in tasks:
+                task.cancel()
+            cancelled = job["completed"] != job["total"]
+            job["status"] = "cancelled" if cancelled else "completed"
+            job["finished_at"] = time.time()
+            
+            success = not cancelled and job["failed"] == 0
+            if cancelled:
+                error_message = f"Cancelled after {job['completed']} of {job['total']} items"
+            elif job["failed"]:
+                error_message = f"{job['failed']} of {job['total']} items failed"
+            else:
+                error_message = None
+            
+            if audit_logger.should_log(success=success):
+                audit_queue.enqueue({
+                    "operation": "seqkit_stats_batches",
+                    "endpoint": "/seqkit/batches",
+                    "parameters": {"items": job["total"]},
+                    "success": success,
+                    "execution_time_ms": elapsed_ms(t0),
+                    "result_summary": {
+                        "job_id": job_id,
+                        "status": job["status"],
+                        "completed_items": job["completed"],
+                        "failed_items": job["failed"]
+                    },
+                    "error_message": error_message
+                })
+    
+    return StreamingResponse(
+        results(),
+        media_type=NDJSON_MEDIA_TYPE,
+        headers={"X-Batch-Job-Id": job_id}
+    )
+
+
+@router.get("/batches/{job_id}")
+async def get_seqkit_batch_status(job_id: str):
+    job = _batch_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Batch job '{job_id}' not found")
+    
+    return job
 
 
 @router.get("/info")
 async def get_seqkit_info():
-    installation_status = validate_seqkit_installation()
-    version = get_seqkit_version() if installation_status else None
+    installation_status, version = get_seqkit_status()
     
     return {
         "seqkit_available": installation_status,
         "seqkit_version": version,
-        "supported_commands": [
-            "stats", "head", "tail", "sample", "seq", "subseq", 
-            "grep", "locate", "rmdup", "common", "split", "sort",
-            "shuffle", "sliding", "range", "restart", "concat",
-            "tab2fx", "fx2tab", "translate", "watch"
-        ],
-        "endpoints": [
-            {
-                "endpoint": "/seqkit/stats",
-                "description": "Generate FASTQ statistics using seqkit stats"
-            },
-            {
-                "endpoint": "/seqkit/command",
-                "description": "Run custom seqkit commands"
-            }
-        ]
-    }
\ No newline at end of file
+        **_INFO_BASE
+    }
@@ -2,8 +2,18 @@
 Configuration utilities for FastX-MCP Server
 """
 import os
-import yaml
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
+
+import yaml
+
+
+# libyaml's C loader when PyYAML was built with it, else the pure-Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+DEFAULT_MCP_CONFIG_PATH = str(Path(__file__).parent.parent.parent / "mcp_config.yaml")
 
 
 def get_mcp_config_path() -> str:
@@ -16,22 +26,23 @@ def get_mcp_config_path() -> str:
     Returns:
         str: Path to the MCP configuration file
     """
-    config_path = os.environ.get("MCP_CONFIG_PATH")
-    if config_path:
-        return config_path
-    
-    # Default to project root
-    project_root = Path(__file__).parent.parent.parent
-    return str(project_root / "mcp_config.yaml")
+    return os.environ.get("MCP_CONFIG_PATH") or DEFAULT_MCP_CONFIG_PATH
+
+
+@lru_cache(maxsize=4)
+def _read_config(config_path: str) -> Mapping:
+    with open(config_path, "r") as f:
+        return MappingProxyType(yaml.load(f, Loader=_YAML_LOADER) or {})
 
 
-def load_mcp_config() -> dict:
+def load_mcp_config() -> Mapping:
     """
     Load MCP configuration from file.
     
+    The file is parsed once per path; later calls return the same read-only
+    mapping.
+    
     Returns:
-        dict: MCP configuration
+        Mapping: MCP configuration
     """
-    config_path = get_mcp_config_path()
-    with open(config_path, "r") as f:
-        return yaml.safe_load(f)
\ No newline at end of file
+    return _read_config(get_mcp_config_path())
\ No newline at end of file
@@ -1,9 +1,10 @@
 import io
-import base64
-from typing import Union, Optional
+from typing import Iterable, Union, Optional, List, Tuple
 from Bio import SeqIO
 from Bio.SeqRecord import SeqRecord
 
+from src.utils.encoding import open_content
+
 
 class ConversionError(Exception):
     pass
@@ -13,14 +14,23 @@ def genbank_to_fasta(
     genbank_content: str, 
     input_format: str = "string"
 ) -> str:
+    fasta_content, _ = genbank_to_fasta_with_summary(
+        genbank_content,
+        input_format=input_format
+    )
+    return fasta_content
+
+
+def genbank_to_fasta_with_summary(
+    genbank_content: str, 
+    input_format: str = "string"
+) -> Tuple[str, dict]:
+    """
+    Convert GenBank to FASTA and summarize the records from the same parse.
+    """
     try:
-        if input_format == "base64":
-            try:
-                genbank_content = base64.b64decode(genbank_content).decode('utf-8')
-            except Exception as e:
-                raise ConversionError(f"Failed to decode base64 input: {str(e)}")
+        genbank_io = open_content(genbank_content, input_format)
         
-        genbank_io = io.StringIO(genbank_content)
         fasta_io = io.StringIO()
         
         records = list(SeqIO.parse(genbank_io, "genbank"))
@@ -34,7 +44,7 @@ def genbank_to_fasta(
         fasta_io.close()
         genbank_io.close()
         
-        return fasta_content
+        return fasta_content, _summarize_records(records)
         
     except Exception as e:
         if isinstance(e, ConversionError):
@@ -47,24 +57,26 @@ def get_conversion_summary(
     input_format: str = "string"
 ) -> dict:
     try:
-        if input_format == "base64":
-            genbank_content = base64.b64decode(genbank_content).decode('utf-8')
-        
-        genbank_io = io.StringIO(genbank_content)
-        records = list(SeqIO.parse(genbank_io, "genbank"))
+        genbank_io = open_content(genbank_content, input_format)
+        summary = _summarize_records(SeqIO.parse(genbank_io, "genbank"))
         genbank_io.close()
         
-        if not records:
-            return {"record_count": 0, "total_length": 0, "record_ids": []}
-        
-        record_ids = [record.id for record in records]
-        total_length = sum(len(record.seq) for record in records)
-        
-        return {
-            "record_count": len(records),
-            "total_length": total_length,
-            "record_ids": record_ids
-        }
+        return summary
         
     except Exception as e:
-        raise ConversionError(f"Failed to analyze GenBank content: {str(e)}")
\ No newline at end of file
+        raise ConversionError(f"Failed to analyze GenBank content: {str(e)}")
+
+
+def _summarize_records(records: Iterable[SeqRecord]) -> dict:
+    record_ids = []
+    total_length = 0
+    
+    for record in records:
+        record_ids.append(record.id)
+        total_length += len(record.seq)
+    
+    return {
+        "record_count": len(record_ids),
+        "total_length": total_length,
+        "record_ids": record_ids
+    }
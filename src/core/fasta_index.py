@@ -0,0 +1,108 @@
+"""
+Record offset index for FASTA content.
+
+Lets ``extract_subsequence`` jump straight to one record instead of parsing
+every record with Biopython. Indexes are cached by content digest, so repeat
+requests against the same FASTA skip the scan entirely.
+"""
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Dict, Iterator, Optional, Tuple
+
+from src.utils.validators import IUPAC_DNA_BYTES
+
+
+INDEX_CACHE_SIZE = 32
+
+@dataclass
+class FastaIndex:
+    # id -> (title, body start, body end); first record wins on duplicate ids
+    records: Dict[str, Tuple[str, int, int]]
+    # Every sequence uses the alphabet accepted by validate_fasta_format, with
+    # no whitespace inside its lines
+    dna_only: bool
+    has_sequence: bool
+
+
+def sequence_bytes(data: bytes, body_start: int, body_end: int) -> Optional[bytes]:
+    """
+    Sequence of a record body with its line breaks removed.
+
+    Returns None when a line holds spaces or tabs: Biopython silently drops
+    them while validation rejects them, so only the Biopython path can treat
+    that record like the rest of the API does.
+    """
+    body = data[body_start:body_end]
+    if b" " in body or b"\t" in body:
+        return None
+    return body.translate(None, b"\n")
+
+
+_cache: "OrderedDict[bytes, FastaIndex]" = OrderedDict()
+_cache_lock = Lock()
+
+
+def iter_records(data: bytes) -> Iterator[Tuple[str, str, int, int]]:
+    """
+    Yield ``(id, title, body start, body end)`` for each record of ASCII
+    FASTA ``data`` (starting with '>'), found by one scan over the record
+    boundaries. The body runs from the header's line break to the next record.
+    """
+    start = 0
+    while start != -1:
+        next_start = data.find(b"\n>", start)
+        record_end = len(data) if next_start == -1 else next_start
+        
+        header_end = data.find(b"\n", start, record_end)
+        if header_end == -1:
+            header_end = record_end
+        
+        title = data[start + 1:header_end].decode("ascii").rstrip()
+        words = title.split(None, 1)
+        yield (words[0] if words else ""), title, header_end, record_end
+        
+        start = -1 if next_start == -1 else next_start + 1
+
+
+def build_offset_index(data: bytes) -> FastaIndex:
+    """
+    Scan ASCII FASTA ``data`` (starting with '>') once for record offsets.
+    """
+    records: Dict[str, Tuple[str, int, int]] = {}
+    dna_only = True
+    has_sequence = False
+    
+    for seq_id, title, body_start, body_end in iter_records(data):
+        records.setdefault(seq_id, (title, body_start, body_end))
+        
+        seq = sequence_bytes(data, body_start, body_end)
+        if seq is None:
+            dna_only = False
+        elif seq:
+            has_sequence = True
+            if dna_only and seq.translate(None, IUPAC_DNA_BYTES):
+                dna_only = False
+    
+    return FastaIndex(records=records, dna_only=dna_only, has_sequence=has_sequence)
+
+
+def get_index(data: bytes) -> FastaIndex:
+    """Return the offset index for ``data``, building it on a cache miss."""
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    
+    with _cache_lock:
+        index = _cache.get(digest)
+        if index is not None:
+            _cache.move_to_end(digest)
+            return index
+    
+    index = build_offset_index(data)
+    
+    with _cache_lock:
+        _cache[digest] = index
+        if len(_cache) > INDEX_CACHE_SIZE:
+            _cache.popitem(last=False)
+    
+    return index
@@ -1,10 +1,19 @@
 import io
-import base64
-from typing import Union, Optional
+from typing import Iterable, Union, Optional, List, Tuple
 from Bio import SeqIO
 from Bio.SeqRecord import SeqRecord
 from Bio.Seq import Seq
 
+from src.core.fasta_index import get_index, iter_records, sequence_bytes
+from src.utils.encoding import decode_content, open_content
+from src.utils.validators import IUPAC_DNA_BYTES, ValidationError, validate_fasta_format
+
+
+# Complement table for the IUPAC DNA alphabet accepted by validate_fasta_format;
+# matches Bio.Seq.reverse_complement for these characters.
+_RC_TABLE = bytes.maketrans(IUPAC_DNA_BYTES, b"TAGCYRSWMKVHDBN-tagcyrswmkvhdbn")
+_FASTA_WRAP = 60
+
 
 class ManipulationError(Exception):
     pass
@@ -12,16 +21,41 @@ class ManipulationError(Exception):
 
 def reverse_complement_fasta(
     fasta_content: str, 
-    input_format: str = "string"
+    input_format: str = "string",
+    validate: bool = False
 ) -> str:
+    result, _ = reverse_complement_with_summary(
+        fasta_content,
+        input_format=input_format,
+        validate=validate
+    )
+    return result
+
+
+def reverse_complement_with_summary(
+    fasta_content: str, 
+    input_format: str = "string",
+    validate: bool = False
+) -> Tuple[str, dict]:
+    """
+    Reverse complement FASTA records and summarize the input records from the same parse.
+
+    With ``validate``, string input that the bytes-level path accepts needs no
+    separate check: that path only accepts content ``validate_fasta_format``
+    would pass. Anything it hands back is checked with
+    ``validate_fasta_format`` before Biopython parses it.
+    """
+    if input_format == "string":
+        fast_result = _fast_reverse_complement(fasta_content)
+        if fast_result is not None:
+            return fast_result
+    
     try:
-        if input_format == "base64":
-            try:
-                fasta_content = base64.b64decode(fasta_content).decode('utf-8')
-            except Exception as e:
-                raise ManipulationError(f"Failed to decode base64 input: {str(e)}")
+        if validate and input_format == "string":
+            validate_fasta_format(fasta_content)
+        
+        fasta_input = open_content(fasta_content, input_format)
         
-        fasta_input = io.StringIO(fasta_content)
         fasta_output = io.StringIO()
         
         records = list(SeqIO.parse(fasta_input, "fasta"))
@@ -48,26 +82,86 @@ def reverse_complement_fasta(
         fasta_output.close()
         fasta_input.close()
         
-        return result
+        return result, _summarize_records(records)
         
     except Exception as e:
-        if isinstance(e, ManipulationError):
+        if isinstance(e, (ManipulationError, ValidationError)):
             raise
         raise ManipulationError(f"Failed to reverse complement FASTA: {str(e)}")
 
 
+def _fast_reverse_complement(fasta_content: str) -> Optional[Tuple[str, dict]]:
+    """
+    Bytes-level reverse complement for plain IUPAC DNA FASTA.
+
+    Produces exactly what the Biopython path writes, but complements with
+    ``bytes.translate`` and reverses with a slice instead of building
+    ``Seq``/``SeqRecord`` objects. Returns None for anything it doesn't
+    handle (non-ASCII, carriage returns, whitespace inside sequence lines,
+    other residues, no sequence data)
+    so the caller falls back to Biopython, which also reports any errors.
+    """
+    if not fasta_content.isascii() or not fasta_content.startswith(">"):
+        return None
+    
+    data = fasta_content.encode("ascii")
+    if b"\r" in data:
+        return None
+    
+    out = []
+    sequences = []
+    total_length = 0
+    
+    for seq_id, title, body_start, body_end in iter_records(data):
+        seq = sequence_bytes(data, body_start, body_end)
+        if seq is None or seq.translate(None, IUPAC_DNA_BYTES):
+            return None
+        
+        rc = seq.translate(_RC_TABLE)[::-1]
+        out.append(f">{seq_id}_rc {title} (reverse complement)\n".encode("ascii"))
+        out.append(_wrap_sequence(rc))
+        
+        total_length += len(seq)
+        sequences.append({
+            "id": seq_id,
+            "description": title,
+            "length": len(seq)
+        })
+    
+    if not total_length:
+        return None
+    
+    summary = {
+        "record_count": len(sequences),
+        "total_length": total_length,
+        "sequences": sequences
+    }
+    return b"".join(out).decode("ascii"), summary
+
+
+def _wrap_sequence(seq: bytes, width: int = _FASTA_WRAP) -> bytes:
+    """Split ``seq`` into newline-terminated lines of ``width`` bytes."""
+    return b"".join([seq[i:i + width] + b"\n" for i in range(0, len(seq), width)])
+
+
 def extract_subsequence(
     fasta_content: str,
     sequence_id: str,
     start: int,
     end: int,
-    input_format: str = "string"
+    input_format: str = "string",
+    validate: bool = False
 ) -> str:
+    if input_format == "string":
+        fast_result = _fast_extract_subsequence(fasta_content, sequence_id, start, end, validate)
+        if fast_result is not None:
+            return fast_result
+    
     try:
-        if input_format == "base64":
-            fasta_content = base64.b64decode(fasta_content).decode('utf-8')
+        if validate and input_format == "string":
+            validate_fasta_format(fasta_content)
         
-        fasta_input = io.StringIO(fasta_content)
+        fasta_input = open_content(fasta_content, input_format)
         records = list(SeqIO.parse(fasta_input, "fasta"))
         fasta_input.close()
         
@@ -103,43 +197,125 @@ def extract_subsequence(
         return result
         
     except Exception as e:
-        if isinstance(e, ManipulationError):
+        if isinstance(e, (ManipulationError, ValidationError)):
             raise
         raise ManipulationError(f"Failed to extract subsequence: {str(e)}")
 
 
+def _fast_extract_subsequence(
+    fasta_content: str,
+    sequence_id: str,
+    start: int,
+    end: int,
+    validate: bool
+) -> Optional[str]:
+    """
+    Extract a subsequence through the cached offset index of the content.
+
+    Only the target record's bytes are cleaned and sliced. Returns None when
+    the content needs the Biopython path (non-ASCII, carriage returns,
+    whitespace inside the target's sequence lines, or content that validation
+    would reject, which Biopython then reports).
+    """
+    if not fasta_content.isascii() or not fasta_content.startswith(">"):
+        return None
+    
+    data = fasta_content.encode("ascii")
+    if b"\r" in data:
+        return None
+    
+    index = get_index(data)
+    if validate and not (index.dna_only and index.has_sequence):
+        return None
+    
+    entry = index.records.get(sequence_id)
+    if entry is None:
+        raise ManipulationError(f"Sequence with ID '{sequence_id}' not found")
+    
+    title, body_start, body_end = entry
+    seq = sequence_bytes(data, body_start, body_end)
+    if seq is None:
+        return None
+    
+    if start < 0 or end > len(seq) or start >= end:
+        raise ManipulationError(
+            f"Invalid coordinates: start={start}, end={end}, sequence_length={len(seq)}"
+        )
+    
+    header = f">{sequence_id}_subseq_{start}_{end} {title} (subsequence {start}-{end})\n"
+    return header + _wrap_sequence(seq[start:end]).decode("ascii")
+
+
 def get_fasta_summary(
     fasta_content: str, 
     input_format: str = "string"
 ) -> dict:
     try:
         if input_format == "base64":
-            fasta_content = base64.b64decode(fasta_content).decode('utf-8')
+            data = decode_content(fasta_content, input_format)
+        elif fasta_content.isascii():
+            data = fasta_content.encode("ascii")
+        else:
+            data = None
         
-        fasta_input = io.StringIO(fasta_content)
-        records = list(SeqIO.parse(fasta_input, "fasta"))
-        fasta_input.close()
+        summary = _scan_fasta_summary(data) if data is not None else None
+        if summary is not None:
+            return summary
         
-        if not records:
-            return {"record_count": 0, "total_length": 0, "sequences": []}
+        fasta_input = open_content(fasta_content, input_format)
+        summary = _summarize_records(SeqIO.parse(fasta_input, "fasta"))
+        fasta_input.close()
         
-        sequences = []
-        total_length = 0
-        
-        for record in records:
-            seq_length = len(record.seq)
-            total_length += seq_length
-            sequences.append({
-                "id": record.id,
-                "description": record.description,
-                "length": seq_length
-            })
-        
-        return {
-            "record_count": len(records),
-            "total_length": total_length,
-            "sequences": sequences
-        }
+        return summary
         
     except Exception as e:
-        raise ManipulationError(f"Failed to analyze FASTA content: {str(e)}")
\ No newline at end of file
+        raise ManipulationError(f"Failed to analyze FASTA content: {str(e)}")
+
+
+def _scan_fasta_summary(data: bytes) -> Optional[dict]:
+    """
+    Summarize ASCII FASTA ``data`` from the record offsets alone.
+
+    No ``SeqRecord`` is built per record. Returns None for input that doesn't
+    start with '>', isn't ASCII, has carriage returns or whitespace inside
+    sequence lines, leaving it to Biopython.
+    """
+    if not data.startswith(b">") or not data.isascii() or b"\r" in data:
+        return None
+    
+    sequences = []
+    total_length = 0
+    
+    for seq_id, title, body_start, body_end in iter_records(data):
+        seq = sequence_bytes(data, body_start, body_end)
+        if seq is None:
+            return None
+        
+        total_length += len(seq)
+        sequences.append({"id": seq_id, "description": title, "length": len(seq)})
+    
+    return {
+        "record_count": len(sequences),
+        "total_length": total_length,
+        "sequences": sequences
+    }
+
+
+def _summarize_records(records: Iterable[SeqRecord]) -> dict:
+    sequences = []
+    total_length = 0
+    
+    for record in records:
+        seq_length = len(record.seq)
+        total_length += seq_length
+        sequences.append({
+            "id": record.id,
+            "description": record.description,
+            "length": seq_length
+        })
+    
+    return {
+        "record_count": len(sequences),
+        "total_length": total_length,
+        "sequences": sequences
+    }
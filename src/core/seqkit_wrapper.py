@@ -1,8 +1,45 @@
+import asyncio
+import csv
+import hashlib
+import io
+import os
+import shutil
 import subprocess
 import tempfile
-import os
-import base64
-from typing import Dict, Any, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, AsyncIterable, AsyncIterator, Iterable, List, Optional, Tuple, Union
+
+from src.utils.encoding import aiter_decoded, decode_to, iter_decoded
+from src.utils.validators import ValidationError
+
+
+# How long a probed seqkit install status is trusted before re-checking
+SEQKIT_STATUS_TTL_S = 300.0
+
+_seqkit_status: Optional[Tuple[bool, Optional[str], float]] = None
+
+# Absolute path of the seqkit binary, resolved once. Spawning through an
+# absolute ``executable`` with ``close_fds=False`` lets subprocess use
+# posix_spawn (vfork) instead of fork, so the cost of starting seqkit doesn't
+# grow with the server's memory. Our own descriptors are non-inheritable
+# (PEP 446), so nothing extra leaks into seqkit.
+SEQKIT_PATH = os.environ.get("SEQKIT_PATH") or shutil.which("seqkit")
+
+# Streamed bodies include the upload itself, so they get longer than 30 s
+RAW_STATS_TIMEOUT_S = 300
+
+# Parsed stats results keyed by content digest, input and output format
+STATS_CACHE_SIZE = int(os.environ.get("SEQKIT_STATS_CACHE_SIZE", "256"))
+
+_stats_cache: "OrderedDict[Tuple[bytes, str, str], Any]" = OrderedDict()
+_stats_cache_lock = threading.Lock()
+
+# Scratch space for payloads seqkit reads by path; RAM-backed where available
+SEQKIT_TMPDIR = os.environ.get("FASTX_MCP_TMPDIR") or (
+    "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+)
 
 
 def parse_seqkit_tabular_output(tabular_text: str) -> Any:
@@ -11,58 +48,206 @@ def parse_seqkit_tabular_output(tabular_text: str) -> Any:
     Assumes tab-separated columns, first line is header.
     Returns a list of dicts if multiple records, or a single dict if one record.
     """
-    lines = [line.strip() for line in tabular_text.strip().splitlines() if line.strip()]
-    if not lines or len(lines) < 2:
+    header, rows = _stats_rows(tabular_text)
+    if not rows:
         return {}
-    header = lines[0].split("\t")
-    records = []
-    for line in lines[1:]:
-        values = line.split("\t")
-        record = dict(zip(header, values))
-        records.append(record)
+    records = [dict(zip(header, row)) for row in rows]
     return records[0] if len(records) == 1 else records
 
 
+def _stats_rows(tabular_text: str) -> Tuple[List[str], List[List[str]]]:
+    """Split tab-separated output into its header and rows, skipping blank lines."""
+    reader = csv.reader(io.StringIO(tabular_text), delimiter="\t", quoting=csv.QUOTE_NONE)
+    rows = (row for row in reader if row)
+    header = next(rows, [])
+    return header, list(rows)
+
+
 class SeqkitError(Exception):
     pass
 
 
+def _spawn_options() -> Dict[str, Any]:
+    if SEQKIT_PATH is None:
+        return {}
+    return {"executable": SEQKIT_PATH, "close_fds": False}
+
+
+def _run_piped(
+    cmd: list, payload: Union[str, Iterable[bytes]], timeout: int
+) -> Tuple[int, str, str]:
+    """
+    Run ``cmd`` with ``payload`` on stdin and return ``(returncode, stdout, stderr)``.
+
+    String payloads go through ``subprocess.run``. Byte chunks (decoded base64)
+    are written to stdin from a feeder thread while seqkit is already reading,
+    so decoding overlaps with processing and the decoded payload is never
+    held in memory as a whole.
+    """
+    if isinstance(payload, str):
+        result = subprocess.run(
+            cmd, input=payload, capture_output=True, text=True, timeout=timeout,
+            **_spawn_options()
+        )
+        return result.returncode, result.stdout, result.stderr
+
+    proc = subprocess.Popen(
+        cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        **_spawn_options()
+    )
+    # The feeder owns stdin; communicate() must not touch it
+    stdin, proc.stdin = proc.stdin, None
+    feed_errors = []
+
+    def feed():
+        try:
+            for chunk in payload:
+                stdin.write(chunk)
+        except BrokenPipeError:
+            pass
+        except Exception as e:
+            feed_errors.append(e)
+        finally:
+            try:
+                stdin.close()
+            except BrokenPipeError:
+                pass
+
+    feeder = threading.Thread(target=feed, daemon=True)
+    feeder.start()
+    try:
+        stdout, stderr = proc.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.communicate()
+        raise
+    finally:
+        feeder.join()
+
+    if feed_errors:
+        raise SeqkitError(f"Failed to decode base64 input: {str(feed_errors[0])}")
+
+    return (
+        proc.returncode,
+        stdout.decode("utf-8", errors="replace"),
+        stderr.decode("utf-8", errors="replace"),
+    )
+
+
+async def _as_async(chunks: Iterable[bytes]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+async def _run_piped_async(
+    cmd: list,
+    payload: Union[str, Iterable[bytes], AsyncIterable[bytes]],
+    timeout: int
+) -> Tuple[int, str, str]:
+    """
+    Async ``_run_piped``: the process is awaited on the event loop instead of
+    blocking a thread for its whole runtime. ``payload`` may also be an async
+    iterable of byte chunks, such as a request body stream.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        **_spawn_options()
+    )
+    if isinstance(payload, str):
+        chunks = _as_async([payload.encode("utf-8")])
+    elif hasattr(payload, "__aiter__"):
+        chunks = payload
+    else:
+        chunks = _as_async(payload)
+    feed_errors = []
+
+    async def feed():
+        try:
+            async for chunk in chunks:
+                # seqkit may stop reading early (e.g. head)
+                if proc.stdin.is_closing():
+                    break
+                proc.stdin.write(chunk)
+                await proc.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        except ValueError as e:
+            feed_errors.append(e)
+        finally:
+            proc.stdin.close()
+
+    try:
+        _, stdout, stderr = await asyncio.wait_for(
+            asyncio.gather(feed(), proc.stdout.read(), proc.stderr.read()), timeout
+        )
+        await proc.wait()
+    except asyncio.TimeoutError:
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    finally:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+
+    if feed_errors:
+        raise SeqkitError(f"Failed to decode base64 input: {str(feed_errors[0])}")
+
+    return (
+        proc.returncode,
+        stdout.decode("utf-8", errors="replace"),
+        stderr.decode("utf-8", errors="replace"),
+    )
+
+
+def format_seqkit_stats(tabular_text: str, output_format: str = "json") -> Any:
+    """Shape ``seqkit stats -T`` output as returned by ``run_seqkit_stats``."""
+    if output_format == "json":
+        try:
+            return parse_seqkit_tabular_output(tabular_text)
+        except Exception as e:
+            raise SeqkitError(f"Failed to parse tabular output: {str(e)}")
+    return {"output": tabular_text.strip()}
+
+
 def run_seqkit_stats(
     fastq_content: str, input_format: str = "string", output_format: str = "json"
 ) -> Dict[str, Any]:
     try:
-        if input_format == "base64":
-            try:
-                fastq_content = base64.b64decode(fastq_content).decode("utf-8")
-            except Exception as e:
-                raise SeqkitError(f"Failed to decode base64 input: {str(e)}")
+        payload = iter_decoded(fastq_content) if input_format == "base64" else fastq_content
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".fastq", delete=False
-        ) as temp_file:
-            temp_file.write(fastq_content)
-            temp_file_path = temp_file.name
+        # Always get tabular output, then parse to JSON if requested
+        cmd = ["seqkit", "stats", "-T", "-"]
+        returncode, stdout, stderr = _run_piped(cmd, payload, timeout=30)
 
-        try:
-            # Always get tabular output, then parse to JSON if requested
-            cmd = ["seqkit", "stats", "-T", temp_file_path]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        if returncode != 0:
+            raise SeqkitError(f"seqkit command failed: {stderr}")
 
-            if result.returncode != 0:
-                raise SeqkitError(f"seqkit command failed: {result.stderr}")
-
-            if output_format == "json":
-                try:
-                    stats_data = parse_seqkit_tabular_output(result.stdout)
-                    return stats_data
-                except Exception as e:
-                    raise SeqkitError(f"Failed to parse tabular output: {str(e)}")
-            else:
-                return {"output": result.stdout.strip()}
+        return format_seqkit_stats(stdout, output_format)
 
-        finally:
-            if os.path.exists(temp_file_path):
-                os.unlink(temp_file_path)
+    except subprocess.TimeoutExpired:
+        raise SeqkitError("seqkit command timed out")
+    except Exception as e:
+        if isinstance(e, SeqkitError):
+            raise
+        raise SeqkitError(f"Failed to run seqkit stats: {str(e)}")
+
+
+async def run_seqkit_stats_async(
+    fastq_content: str, input_format: str = "string", output_format: str = "json"
+) -> Dict[str, Any]:
+    """Async ``run_seqkit_stats`` for use from request handlers."""
+    try:
+        payload = iter_decoded(fastq_content) if input_format == "base64" else fastq_content
+
+        cmd = ["seqkit", "stats", "-T", "-"]
+        returncode, stdout, stderr = await _run_piped_async(cmd, payload, timeout=30)
+
+        if returncode != 0:
+            raise SeqkitError(f"seqkit command failed: {stderr}")
+
+        return format_seqkit_stats(stdout, output_format)
 
     except subprocess.TimeoutExpired:
         raise SeqkitError("seqkit command timed out")
@@ -72,36 +257,194 @@ def run_seqkit_stats(
         raise SeqkitError(f"Failed to run seqkit stats: {str(e)}")
 
 
+async def run_seqkit_stats_stream(
+    chunks: AsyncIterable[bytes], input_format: str = "string", output_format: str = "json"
+) -> Dict[str, Any]:
+    """
+    ``run_seqkit_stats_async`` over FASTQ arriving as byte chunks.
+
+    Chunks are written to seqkit's stdin as they come in, so the payload is
+    never held in memory as a whole. A ``ValidationError`` raised by
+    ``chunks`` (e.g. a size limit) propagates unchanged.
+    """
+    try:
+        payload = aiter_decoded(chunks) if input_format == "base64" else chunks
+
+        cmd = ["seqkit", "stats", "-T", "-"]
+        returncode, stdout, stderr = await _run_piped_async(
+            cmd, payload, timeout=RAW_STATS_TIMEOUT_S
+        )
+
+        if returncode != 0:
+            raise SeqkitError(f"seqkit command failed: {stderr}")
+
+        return format_seqkit_stats(stdout, output_format)
+
+    except subprocess.TimeoutExpired:
+        raise SeqkitError("seqkit command timed out")
+    except Exception as e:
+        if isinstance(e, (SeqkitError, ValidationError)):
+            raise
+        raise SeqkitError(f"Failed to run seqkit stats: {str(e)}")
+
+
+def stats_cache_key(
+    fastq_content: str, input_format: str = "string", output_format: str = "json"
+) -> Tuple[bytes, str, str]:
+    digest = hashlib.blake2b(fastq_content.encode("utf-8"), digest_size=16).digest()
+    return digest, input_format, output_format
+
+
+def get_cached_stats(key: Tuple[bytes, str, str]) -> Optional[Any]:
+    with _stats_cache_lock:
+        if key in _stats_cache:
+            _stats_cache.move_to_end(key)
+            return _stats_cache[key]
+    return None
+
+
+def cache_stats(key: Tuple[bytes, str, str], stats: Any):
+    if STATS_CACHE_SIZE <= 0:
+        return
+
+    with _stats_cache_lock:
+        _stats_cache[key] = stats
+        if len(_stats_cache) > STATS_CACHE_SIZE:
+            _stats_cache.popitem(last=False)
+
+
+def run_seqkit_stats_cached(
+    fastq_content: str, input_format: str = "string", output_format: str = "json"
+) -> Tuple[Any, bool]:
+    """
+    ``run_seqkit_stats`` behind an LRU cache keyed on a content digest.
+
+    Returns ``(stats, cache_hit)``. Only successful runs are cached; a
+    ``STATS_CACHE_SIZE`` of 0 disables caching.
+    """
+    if STATS_CACHE_SIZE <= 0:
+        return run_seqkit_stats(fastq_content, input_format, output_format), False
+
+    key = stats_cache_key(fastq_content, input_format, output_format)
+    stats = get_cached_stats(key)
+    if stats is not None:
+        return stats, True
+
+    stats = run_seqkit_stats(fastq_content, input_format, output_format)
+    cache_stats(key, stats)
+    return stats, False
+
+
+def run_seqkit_stats_batch(
+    payloads: List[Tuple[str, str]], timeout: int = 30
+) -> List[Union[str, SeqkitError]]:
+    """
+    Run ``seqkit stats -T`` once over several ``(content, input_format)`` payloads.
+
+    Each payload is written to its own file in a temporary directory and
+    seqkit reports one row per file. Returns, per payload, the tabular text a
+    stdin run on that payload alone would have printed, or the ``SeqkitError``
+    it failed with. If the combined run fails (e.g. one malformed payload),
+    the files are run one at a time so each error reaches its own caller.
+    """
+    results: List[Union[str, SeqkitError, None]] = [None] * len(payloads)
+
+    with tempfile.TemporaryDirectory(prefix="seqkit-stats-", dir=SEQKIT_TMPDIR) as tmpdir:
+        paths = {}
+        for i, (content, input_format) in enumerate(payloads):
+            path = os.path.join(tmpdir, f"{i}.fastq")
+            try:
+                with open(path, "wb") as f:
+                    if input_format == "base64":
+                        decode_to(f, content)
+                    else:
+                        f.write(content.encode("utf-8"))
+            except ValueError as e:
+                results[i] = SeqkitError(f"Failed to decode base64 input: {str(e)}")
+                continue
+            paths[path] = i
+
+        def run(files: List[str]) -> subprocess.CompletedProcess:
+            return subprocess.run(
+                ["seqkit", "stats", "-T"] + files,
+                capture_output=True, text=True, timeout=timeout,
+                **_spawn_options()
+            )
+
+        rows = {}
+        if paths:
+            try:
+                result = run(list(paths))
+            except subprocess.TimeoutExpired:
+                result = None
+            if result is not None and result.returncode == 0:
+                header, found = _stats_rows(result.stdout)
+                if "file" in header:
+                    column = header.index("file")
+                    rows = {row[column]: row for row in found if len(row) == len(header)}
+
+        for path, i in paths.items():
+            if path in rows:
+                row = rows[path]
+                row[header.index("file")] = "-"
+                results[i] = "\t".join(header) + "\n" + "\t".join(row) + "\n"
+                continue
+
+            try:
+                result = run([path])
+            except subprocess.TimeoutExpired:
+                results[i] = SeqkitError("seqkit command timed out")
+                continue
+            if result.returncode != 0:
+                results[i] = SeqkitError(f"seqkit command failed: {result.stderr}")
+            else:
+                results[i] = result.stdout.replace(path, "-")
+
+    return results
+
+
 def run_seqkit_command(
     fastq_content: str, command: str, args: list = None, input_format: str = "string"
 ) -> str:
     try:
-        if input_format == "base64":
-            fastq_content = base64.b64decode(fastq_content).decode("utf-8")
+        payload = iter_decoded(fastq_content) if input_format == "base64" else fastq_content
 
         if args is None:
             args = []
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".fastq", delete=False
-        ) as temp_input:
-            temp_input.write(fastq_content)
-            temp_input_path = temp_input.name
+        cmd = ["seqkit", command] + args + ["-"]
 
-        try:
-            cmd = ["seqkit", command] + args + [temp_input_path]
+        returncode, stdout, stderr = _run_piped(cmd, payload, timeout=60)
 
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+        if returncode != 0:
+            raise SeqkitError(f"seqkit {command} failed: {stderr}")
 
-            if result.returncode != 0:
-                raise SeqkitError(f"seqkit {command} failed: {result.stderr}")
+        # Optionally parse tabular output if caller requests
+        return stdout
 
-            # Optionally parse tabular output if caller requests
-            return result.stdout
+    except subprocess.TimeoutExpired:
+        raise SeqkitError(f"seqkit {command} command timed out")
+    except Exception as e:
+        if isinstance(e, SeqkitError):
+            raise
+        raise SeqkitError(f"Failed to run seqkit {command}: {str(e)}")
 
-        finally:
-            if os.path.exists(temp_input_path):
-                os.unlink(temp_input_path)
+
+async def run_seqkit_command_async(
+    fastq_content: str, command: str, args: list = None, input_format: str = "string"
+) -> str:
+    """Async ``run_seqkit_command`` for use from request handlers."""
+    try:
+        payload = iter_decoded(fastq_content) if input_format == "base64" else fastq_content
+
+        cmd = ["seqkit", command] + (args or []) + ["-"]
+
+        returncode, stdout, stderr = await _run_piped_async(cmd, payload, timeout=60)
+
+        if returncode != 0:
+            raise SeqkitError(f"seqkit {command} failed: {stderr}")
+
+        return stdout
 
     except subprocess.TimeoutExpired:
         raise SeqkitError(f"seqkit {command} command timed out")
@@ -114,7 +457,8 @@ def run_seqkit_command(
 def validate_seqkit_installation() -> bool:
     try:
         result = subprocess.run(
-            ["seqkit", "version"], capture_output=True, text=True, timeout=10
+            ["seqkit", "version"], capture_output=True, text=True, timeout=10,
+            **_spawn_options()
         )
         return result.returncode == 0
     except Exception:
@@ -124,7 +468,8 @@ def validate_seqkit_installation() -> bool:
 def get_seqkit_version() -> Optional[str]:
     try:
         result = subprocess.run(
-            ["seqkit", "version"], capture_output=True, text=True, timeout=10
+            ["seqkit", "version"], capture_output=True, text=True, timeout=10,
+            **_spawn_options()
         )
 
         if result.returncode == 0:
@@ -133,3 +478,21 @@ def get_seqkit_version() -> Optional[str]:
 
     except Exception:
         return None
+
+
+def get_seqkit_status(refresh: bool = False) -> Tuple[bool, Optional[str]]:
+    """
+    Return ``(available, version)`` for the seqkit install.
+
+    The result of a single ``seqkit version`` probe is cached for
+    ``SEQKIT_STATUS_TTL_S`` seconds so request handlers don't spawn a
+    process on every call. Pass ``refresh=True`` to probe again immediately.
+    """
+    global _seqkit_status
+
+    now = time.monotonic()
+    if refresh or _seqkit_status is None or now - _seqkit_status[2] > SEQKIT_STATUS_TTL_S:
+        version = get_seqkit_version()
+        _seqkit_status = (version is not None, version, now)
+
+    return _seqkit_status[0], _seqkit_status[1]
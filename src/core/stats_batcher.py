@@ -0,0 +1,201 @@
+"""
+Dynamic batching for ``seqkit stats``.
+
+Concurrent stats requests are held for up to ``MAX_DELAY_S`` (or until
+``MAX_BATCH_SIZE`` of them arrive) and served by a single ``seqkit stats``
+run over all their payloads, so one process start is shared by the whole
+batch. When no batcher is running (e.g. the app was used without its
+lifespan), requests run seqkit on their own as before.
+"""
+import asyncio
+import time
+from typing import Any, Callable, List, Optional, Set, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from src.core.seqkit_wrapper import (
+    cache_stats,
+    format_seqkit_stats,
+    get_cached_stats,
+    run_seqkit_stats_async,
+    run_seqkit_stats_batch,
+    stats_cache_key,
+)
+from src.utils import audit_queue
+from src.utils.logging import audit_logger
+from src.utils.timing import elapsed_ms
+
+
+MAX_BATCH_SIZE = 16
+MAX_DELAY_S = 0.02
+
+# Endpoint label of the per-batch audit entries
+BATCH_AUDIT_ENDPOINT = "internal:stats_batcher"
+
+
+class DynBatcher:
+    """
+    Coalesce submitted items into batches for a blocking ``process_batch``.
+
+    ``process_batch`` takes a list of items and returns one result per item,
+    in order; a result that is an exception is raised to its submitter.
+    Batches run in the worker thread pool, several at a time if needed.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[Any]], List[Any]],
+        max_batch_size: int = MAX_BATCH_SIZE,
+        max_delay: float = MAX_DELAY_S,
+    ):
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._queue: Optional[asyncio.Queue] = None
+        self._collector: Optional[asyncio.Task] = None
+        self._running: Set[asyncio.Task] = set()
+
+    def start(self):
+        if self._collector is not None:
+            return
+        self._queue = asyncio.Queue()
+        self._collector = asyncio.create_task(self._collect_forever())
+
+    async def stop(self):
+        if self._collector is None:
+            return
+
+        self._collector.cancel()
+        try:
+            await self._collector
+        except asyncio.CancelledError:
+            pass
+
+        # Serve whatever was still waiting, then let in-flight batches finish
+        batch = []
+        while not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        if batch:
+            self._dispatch(batch)
+        if self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
+
+        self._queue = None
+        self._collector = None
+
+    async def submit(self, item: Any) -> Any:
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((item, future))
+        return await future
+
+    async def _collect(self) -> List[Tuple[Any, asyncio.Future]]:
+        loop = asyncio.get_running_loop()
+
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_delay
+
+        while len(batch) < self.max_batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _collect_forever(self):
+        while True:
+            self._dispatch(await self._collect())
+
+    def _dispatch(self, batch: List[Tuple[Any, asyncio.Future]]):
+        task = asyncio.create_task(self._run(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: List[Tuple[Any, asyncio.Future]]):
+        t0 = time.perf_counter_ns()
+        items = [item for item, _ in batch]
+        
+        try:
+            results = await run_in_threadpool(self.process_batch, items)
+        except Exception as e:
+            results = [e] * len(batch)
+        
+        failed = 0
+        for (_, future), result in zip(batch, results):
+            if isinstance(result, Exception):
+                failed += 1
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+        
+        # Each request is audited by its own route; this entry only describes
+        # the shared run, under an endpoint no client can call
+        success = failed == 0
+        if audit_logger.should_log(success=success):
+            audit_queue.enqueue({
+                "operation": "seqkit_stats_batch",
+                "endpoint": BATCH_AUDIT_ENDPOINT,
+                "parameters": {
+                    "batch_size": len(batch),
+                    "max_batch_size": self.max_batch_size,
+                },
+                "success": success,
+                "execution_time_ms": elapsed_ms(t0),
+                "result_summary": {"failed_items": failed},
+            })
+
+
+_batcher: Optional[DynBatcher] = None
+
+
+def start():
+    """Start the stats batcher on the running event loop."""
+    global _batcher
+
+    if _batcher is None:
+        _batcher = DynBatcher(run_seqkit_stats_batch)
+        _batcher.start()
+
+
+async def stop():
+    """Stop the stats batcher once queued requests have been served."""
+    global _batcher
+
+    if _batcher is not None:
+        await _batcher.stop()
+        _batcher = None
+
+
+async def run_seqkit_stats_batched(
+    fastq_content: str, input_format: str = "string", output_format: str = "json"
+) -> Tuple[Any, bool]:
+    """
+    Async counterpart of ``run_seqkit_stats_cached`` that goes through the batcher.
+
+    Returns ``(stats, cache_hit)``.
+    """
+    key = stats_cache_key(fastq_content, input_format, output_format)
+    stats = get_cached_stats(key)
+    if stats is not None:
+        return stats, True
+
+    if _batcher is None:
+        stats = await run_seqkit_stats_async(fastq_content, input_format, output_format)
+    else:
+        tabular_text = await _batcher.submit((fastq_content, input_format))
+        stats = format_seqkit_stats(tabular_text, output_format)
+
+    cache_stats(key, stats)
+    return stats, False
@@ -0,0 +1,87 @@
+"""
+Process pool for work that should not share the server's GIL.
+
+The pool is started in the app lifespan. When it isn't running (e.g. the app
+was used without its lifespan), ``run_in_pool`` falls back to the anyio
+worker threads so callers behave the same either way. A pool left broken by
+a dead worker (e.g. one killed for running out of memory) is replaced.
+"""
+import asyncio
+import functools
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+from fastapi import HTTPException
+from starlette.concurrency import run_in_threadpool
+
+from src.utils.logging import logger
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_max_workers: Optional[int] = None
+
+
+def _new_pool() -> ProcessPoolExecutor:
+    # spawn, not fork: the server process already runs threads
+    return ProcessPoolExecutor(
+        max_workers=_max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def start(max_workers: Optional[int] = None):
+    """Start the process pool; ``max_workers`` defaults to the CPU count."""
+    global _pool, _max_workers
+
+    if _pool is None:
+        _max_workers = max_workers or os.cpu_count() or 1
+        _pool = _new_pool()
+
+
+def _replace_broken(pool: ProcessPoolExecutor):
+    """Swap in a fresh pool unless ``pool`` was already replaced or stopped."""
+    global _pool
+
+    if _pool is pool:
+        logger.warning("Worker process died; restarting the process pool")
+        pool.shutdown(wait=False, cancel_futures=True)
+        _pool = _new_pool()
+
+
+def stop():
+    """Shut the pool down, dropping work that hasn't started."""
+    global _pool
+
+    if _pool is not None:
+        _pool.shutdown(wait=True, cancel_futures=True)
+        _pool = None
+
+
+async def run_in_pool(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Run ``fn(*args, **kwargs)`` in the process pool and await its result.
+
+    ``fn`` and its arguments must be picklable (module-level functions).
+    If a worker dies the pool is replaced and the call retried once; a
+    second failure is a 503.
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(fn, *args, **kwargs)
+
+    for _ in range(2):
+        pool = _pool
+        if pool is None:
+            return await run_in_threadpool(call)
+
+        try:
+            return await loop.run_in_executor(pool, call)
+        except BrokenProcessPool:
+            _replace_broken(pool)
+
+    raise HTTPException(
+        status_code=503,
+        detail="Worker process pool failed; please retry the request"
+    )
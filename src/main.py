@@ -1,17 +1,26 @@
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.openapi.utils import get_openapi
+import os
+import subprocess
 import time
 from contextlib import asynccontextmanager
 
+import anyio
+
 from src.api.convert import router as convert_router
 from src.api.manipulate import router as manipulate_router
 from src.api.seqkit import router as seqkit_router
 from src.api.logs import router as logs_router
+from src.api.dependencies import add_json_body_components
 from src.mcp.endpoints import router as mcp_router
 from src.utils.logging import logger, audit_logger
-from src.core.seqkit_wrapper import validate_seqkit_installation
+from src.utils import audit_queue
+from src.utils.timing import elapsed_ms
+from src.core.seqkit_wrapper import get_seqkit_status, SEQKIT_TMPDIR
+from src.core import stats_batcher, workers
 from src.core.config import load_mcp_config
 
 
@@ -19,16 +28,43 @@ from src.core.config import load_mcp_config
 async def lifespan(app: FastAPI):
     logger.info("Starting FastX-MCP Server...")
 
-    seqkit_available = validate_seqkit_installation()
+    seqkit_available, _ = get_seqkit_status(refresh=True)
     if seqkit_available:
         logger.info("seqkit installation validated successfully")
     else:
         logger.warning("seqkit not found - seqkit operations will be unavailable")
+    logger.info("seqkit scratch directory: %s", SEQKIT_TMPDIR)
+    if not getattr(subprocess, "_USE_POSIX_SPAWN", False):
+        logger.warning("posix_spawn unavailable - seqkit processes will be started with fork")
+
+    # Conversions run in the anyio worker pool; size it to the machine
+    # rather than anyio's fixed default of 40 threads.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = (os.cpu_count() or 1) * 2
+
+    # Parse mcp_config.yaml now (load_mcp_config caches it) so a broken file
+    # fails startup rather than the first /mcp/manifest request
+    load_mcp_config()
+    # Build the OpenAPI schema now rather than on the first /docs hit
+    app.openapi()
+
+    audit_queue.start()
+    stats_batcher.start()
+
+    # Several uvicorn workers already spread requests over the cores; a
+    # process pool in each of them would oversubscribe the machine.
+    if int(os.environ.get("WEB_CONCURRENCY", "1")) > 1:
+        logger.info("Multiple workers: CPU-bound work runs in threads")
+    else:
+        workers.start()
 
     yield
 
     logger.info("Shutting down FastX-MCP Server...")
 
+    await stats_batcher.stop()
+    workers.stop()
+    await audit_queue.stop()
+
 
 app = FastAPI(
     title="FastX-MCP Server",
@@ -36,13 +72,11 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
 
-mcp_config = load_mcp_config()
-
-
 def custom_openapi():
     if app.openapi_schema:
         return app.openapi_schema
@@ -52,7 +86,7 @@ def custom_openapi():
         description="MCP Server for FASTA/FASTQ manipulation and file conversion",
         routes=app.routes,
     )
-    app.openapi_schema = openapi_schema
+    app.openapi_schema = add_json_body_components(openapi_schema)
     return app.openapi_schema
 
 
@@ -67,57 +101,62 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(GZipMiddleware, minimum_size=4096, compresslevel=5)
+
 
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
-    start_time = time.time()
+    t0 = time.perf_counter_ns()
 
     try:
         response = await call_next(request)
 
-        process_time = (time.time() - start_time) * 1000
-
-        audit_logger.log_operation(
-            operation="http_request",
-            endpoint=str(request.url.path),
-            parameters={
-                "method": request.method,
-                "query_params": dict(request.query_params),
-                "client_host": request.client.host if request.client else "unknown",
-            },
-            success=response.status_code < 400,
-            execution_time_ms=process_time,
-            result_summary={
-                "status_code": response.status_code,
-                "response_time_ms": round(process_time, 2),
-            },
-        )
+        process_time = elapsed_ms(t0)
+        success = response.status_code < 400
+
+        if audit_logger.should_log(success):
+            audit_queue.enqueue({
+                "operation": "http_request",
+                "endpoint": str(request.url.path),
+                "parameters": {
+                    "method": request.method,
+                    "query_params": dict(request.query_params),
+                    "client_host": request.client.host if request.client else "unknown",
+                },
+                "success": success,
+                "execution_time_ms": process_time,
+                "result_summary": {
+                    "status_code": response.status_code,
+                    "response_time_ms": round(process_time, 2),
+                },
+            })
 
         return response
 
     except Exception as e:
-        process_time = (time.time() - start_time) * 1000
-
-        audit_logger.log_operation(
-            operation="http_request",
-            endpoint=str(request.url.path),
-            parameters={
-                "method": request.method,
-                "query_params": dict(request.query_params),
-                "client_host": request.client.host if request.client else "unknown",
-            },
-            success=False,
-            execution_time_ms=process_time,
-            result_summary={},
-            error_message=str(e),
-        )
+        process_time = elapsed_ms(t0)
+
+        if audit_logger.should_log(False):
+            audit_queue.enqueue({
+                "operation": "http_request",
+                "endpoint": str(request.url.path),
+                "parameters": {
+                    "method": request.method,
+                    "query_params": dict(request.query_params),
+                    "client_host": request.client.host if request.client else "unknown",
+                },
+                "success": False,
+                "execution_time_ms": process_time,
+                "result_summary": {},
+                "error_message": str(e),
+            })
 
         raise
 
 
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": exc.detail,
@@ -129,8 +168,8 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
-    logger.error(f"Unhandled exception: {str(exc)}")
-    return JSONResponse(
+    logger.error("Unhandled exception: %s", exc)
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
@@ -157,7 +196,7 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    seqkit_available = validate_seqkit_installation()
+    seqkit_available, _ = get_seqkit_status()
 
     return {
         "status": "healthy",
@@ -176,4 +215,13 @@ app.include_router(mcp_router, prefix="/mcp", tags=["MCP"])
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # The audit log lives in process memory, so each worker keeps its own;
+    # WEB_CONCURRENCY defaults to a single worker for that reason.
+    uvicorn.run(
+        "src.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.environ.get("WEB_CONCURRENCY", "1")),
+    )
@@ -4,63 +4,100 @@ MCP Endpoints - FastAPI router for MCP protocol endpoints
 import time
 from datetime import datetime
 from fastapi import APIRouter, HTTPException
-from typing import Dict, Any
+from fastapi.responses import ORJSONResponse, Response
+from typing import Callable, Dict, Any, Tuple
+import orjson
 
 from .registry import get_tools, get_tools_summary
-from src.core.seqkit_wrapper import validate_seqkit_installation
+from src.core.config import load_mcp_config
+from src.core.seqkit_wrapper import get_seqkit_status
 
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
-# Track server startup time for uptime calculation
-SERVER_START_TIME = time.time()
+# Track server startup time for uptime calculation (monotonic, so clock
+# adjustments can't skew it)
+SERVER_START_TIME = time.monotonic()
+
+# How long the serialized /manifest body is reused (its generated_at
+# timestamp may be this stale)
+RESPONSE_CACHE_TTL_S = 60
+
+_response_cache: Dict[str, Tuple[float, bytes]] = {}
+
+# (epoch second, ISO timestamp) last handed out by _iso_now
+_last_timestamp: Tuple[int, str] = (0, "")
+
+
+def _iso_now() -> str:
+    """UTC ISO timestamp to the second, formatted at most once per second."""
+    global _last_timestamp
+    
+    now = int(time.time())
+    if now != _last_timestamp[0]:
+        _last_timestamp = (now, datetime.utcfromtimestamp(now).isoformat() + "Z")
+    return _last_timestamp[1]
+
+
+def _cached_json(key: str, build: Callable[[], Dict[str, Any]]) -> Response:
+    now = time.monotonic()
+    cached = _response_cache.get(key)
+    if cached is None or now - cached[0] > RESPONSE_CACHE_TTL_S:
+        cached = (now, orjson.dumps(build()))
+        _response_cache[key] = cached
+    
+    return Response(
+        cached[1],
+        media_type="application/json",
+        headers={"Cache-Control": f"public, max-age={RESPONSE_CACHE_TTL_S}"}
+    )
+
+
+# The tool list is static: it is serialized once and embedded as a Fragment
+_TOOLS_STATIC = {
+    "tools": orjson.Fragment(orjson.dumps(get_tools())),
+    "count": len(get_tools())
+}
+
+
+def _build_manifest() -> Dict[str, Any]:
+    # Parsed once and cached by load_mcp_config
+    mcp_config = load_mcp_config()
+    
+    return {
+        "protocol_version": mcp_config["mcp_protocol_version"],
+        "server_version": "1.0.0",
+        "server_name": "FastX-MCP",
+        "description": "MCP Server for FASTA/FASTQ manipulation and file conversion",
+        "features": mcp_config.get("features", []),
+        "capabilities": {
+            "tools": True,
+            "logging": True,
+            "seqkit_integration": get_seqkit_status()[0]
+        },
+        "tools_summary": get_tools_summary(),
+        "generated_at": _iso_now()
+    }
 
 
 @router.get("/tools")
-async def get_mcp_tools() -> Dict[str, Any]:
+async def get_mcp_tools():
     """
     Get all available tools in MCP-compatible format
     """
-    try:
-        tools = get_tools()
-        return {
-            "tools": tools,
-            "count": len(tools),
-            "generated_at": datetime.utcnow().isoformat() + "Z"
-        }
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to retrieve tools: {str(e)}"
-        )
+    return Response(
+        orjson.dumps({**_TOOLS_STATIC, "generated_at": _iso_now()}),
+        media_type="application/json"
+    )
 
 
 @router.get("/manifest")
-async def get_mcp_manifest() -> Dict[str, Any]:
+async def get_mcp_manifest():
     """
     Get MCP server manifest with protocol version and capabilities
     """
     try:
-        # Load config here to avoid circular imports
-        from src.core.config import load_mcp_config
-        mcp_config = load_mcp_config()
-        
-        tools_summary = get_tools_summary()
-        
-        return {
-            "protocol_version": mcp_config["mcp_protocol_version"],
-            "server_version": "1.0.0",
-            "server_name": "FastX-MCP",
-            "description": "MCP Server for FASTA/FASTQ manipulation and file conversion",
-            "features": mcp_config.get("features", []),
-            "capabilities": {
-                "tools": True,
-                "logging": True,
-                "seqkit_integration": validate_seqkit_installation()
-            },
-            "tools_summary": tools_summary,
-            "generated_at": datetime.utcnow().isoformat() + "Z"
-        }
+        return _cached_json("manifest", _build_manifest)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -74,13 +111,13 @@ async def get_mcp_status() -> Dict[str, Any]:
     Get MCP server status and health information
     """
     try:
-        seqkit_available = validate_seqkit_installation()
+        seqkit_available, _ = get_seqkit_status()
         tools = get_tools()
         
         return {
             "status": "healthy",
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "uptime_seconds": time.time() - SERVER_START_TIME,
+            "timestamp": _iso_now(),
+            "uptime_seconds": time.monotonic() - SERVER_START_TIME,
             "services": {
                 "biopython": True,
                 "seqkit": seqkit_available,
@@ -103,30 +140,31 @@ async def get_mcp_status() -> Dict[str, Any]:
         )
 
 
+_INFO_BYTES = orjson.dumps({
+    "name": "FastX-MCP Server",
+    "description": "MCP Server for FASTA/FASTQ manipulation and file conversion",
+    "version": "1.0.0",
+    "protocol_version": "2025-06-18",
+    "endpoints": {
+        "tools": "/mcp/tools",
+        "manifest": "/mcp/manifest", 
+        "status": "/mcp/status",
+        "info": "/mcp/info"
+    },
+    "documentation": {
+        "openapi": "/docs",
+        "redoc": "/redoc"
+    }
+})
+
+
 @router.get("/info")
-async def get_mcp_info() -> Dict[str, Any]:
+async def get_mcp_info():
     """
     Get general information about the MCP server
     """
-    try:
-        return {
-            "name": "FastX-MCP Server",
-            "description": "MCP Server for FASTA/FASTQ manipulation and file conversion",
-            "version": "1.0.0",
-            "protocol_version": "2025-06-18",
-            "endpoints": {
-                "tools": "/mcp/tools",
-                "manifest": "/mcp/manifest", 
-                "status": "/mcp/status",
-                "info": "/mcp/info"
-            },
-            "documentation": {
-                "openapi": "/docs",
-                "redoc": "/redoc"
-            }
-        }
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to retrieve server info: {str(e)}"
-        )
\ No newline at end of file
+    return Response(
+        _INFO_BYTES,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=3600"}
+    )
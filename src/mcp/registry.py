@@ -8,86 +8,106 @@ from src.api.manipulate import ReverseComplementRequest, ReverseComplementRespon
 from src.api.seqkit import SeqkitStatsRequest, SeqkitStatsResponse, SeqkitCommandRequest, SeqkitCommandResponse
 
 
+# Generated eagerly so schema errors surface at import, not on a request
+_SCHEMA_CACHE: Dict[Any, Dict[str, Any]] = {
+    model_class: model_class.model_json_schema()
+    for model_class in (
+        GenBankToFastaRequest, GenBankToFastaResponse,
+        ReverseComplementRequest, ReverseComplementResponse,
+        SubsequenceRequest, SubsequenceResponse,
+        SeqkitStatsRequest, SeqkitStatsResponse,
+        SeqkitCommandRequest, SeqkitCommandResponse,
+    )
+}
+
+
 def get_tool_schema(model_class) -> Dict[str, Any]:
-    """Get JSON schema for a Pydantic model"""
-    return model_class.model_json_schema()
+    """Get JSON schema for a Pydantic model (generated once per model)"""
+    schema = _SCHEMA_CACHE.get(model_class)
+    if schema is None:
+        schema = _SCHEMA_CACHE[model_class] = model_class.model_json_schema()
+    return schema
+
+
+# Built once at import; the descriptors are static and must not be mutated
+_TOOLS: List[Dict[str, Any]] = [
+    {
+        "name": "genbank_to_fasta",
+        "description": "Convert GenBank format files to FASTA format with optional summary statistics",
+        "method": "POST",
+        "path": "/convert/genbank-to-fasta",
+        "input_schema": get_tool_schema(GenBankToFastaRequest),
+        "output_schema": get_tool_schema(GenBankToFastaResponse),
+        "tags": ["conversion", "genbank", "fasta"]
+    },
+    {
+        "name": "reverse_complement",
+        "description": "Generate reverse complement of all sequences in a FASTA file",
+        "method": "POST", 
+        "path": "/manipulate/reverse-complement",
+        "input_schema": get_tool_schema(ReverseComplementRequest),
+        "output_schema": get_tool_schema(ReverseComplementResponse),
+        "tags": ["manipulation", "fasta", "reverse-complement"]
+    },
+    {
+        "name": "extract_subsequence",
+        "description": "Extract subsequence by coordinates from a specific sequence in FASTA file",
+        "method": "POST",
+        "path": "/manipulate/extract-subsequence", 
+        "input_schema": get_tool_schema(SubsequenceRequest),
+        "output_schema": get_tool_schema(SubsequenceResponse),
+        "tags": ["manipulation", "fasta", "subsequence"]
+    },
+    {
+        "name": "seqkit_stats",
+        "description": "Generate FASTQ statistics using seqkit stats command",
+        "method": "POST",
+        "path": "/seqkit/stats",
+        "input_schema": get_tool_schema(SeqkitStatsRequest),
+        "output_schema": get_tool_schema(SeqkitStatsResponse),
+        "tags": ["seqkit", "statistics", "fastq"]
+    },
+    {
+        "name": "seqkit_command", 
+        "description": "Run custom seqkit commands on FASTQ files",
+        "method": "POST",
+        "path": "/seqkit/command",
+        "input_schema": get_tool_schema(SeqkitCommandRequest),
+        "output_schema": get_tool_schema(SeqkitCommandResponse),
+        "tags": ["seqkit", "command", "fastq"]
+    }
+]
+
+_TOOLS_BY_NAME: Dict[str, Dict[str, Any]] = {tool["name"]: tool for tool in _TOOLS}
+
+_TOOL_TAGS = [frozenset(tool["tags"]) for tool in _TOOLS]
+
+_TOOLS_SUMMARY: Dict[str, Any] = {
+    "total_tools": len(_TOOLS),
+    "tools_by_category": {
+        category: sum(category in tags for tags in _TOOL_TAGS)
+        for category in ("conversion", "manipulation", "seqkit")
+    },
+    "supported_formats": {
+        "input": ["string", "base64"],
+        "sequence_types": ["FASTA", "FASTQ", "GenBank"]
+    }
+}
 
 
 def get_tools() -> List[Dict[str, Any]]:
     """Return list of all available tools with their MCP-compatible descriptors"""
-    tools = [
-        {
-            "name": "genbank_to_fasta",
-            "description": "Convert GenBank format files to FASTA format with optional summary statistics",
-            "method": "POST",
-            "path": "/convert/genbank-to-fasta",
-            "input_schema": get_tool_schema(GenBankToFastaRequest),
-            "output_schema": get_tool_schema(GenBankToFastaResponse),
-            "tags": ["conversion", "genbank", "fasta"]
-        },
-        {
-            "name": "reverse_complement",
-            "description": "Generate reverse complement of all sequences in a FASTA file",
-            "method": "POST", 
-            "path": "/manipulate/reverse-complement",
-            "input_schema": get_tool_schema(ReverseComplementRequest),
-            "output_schema": get_tool_schema(ReverseComplementResponse),
-            "tags": ["manipulation", "fasta", "reverse-complement"]
-        },
-        {
-            "name": "extract_subsequence",
-            "description": "Extract subsequence by coordinates from a specific sequence in FASTA file",
-            "method": "POST",
-            "path": "/manipulate/extract-subsequence", 
-            "input_schema": get_tool_schema(SubsequenceRequest),
-            "output_schema": get_tool_schema(SubsequenceResponse),
-            "tags": ["manipulation", "fasta", "subsequence"]
-        },
-        {
-            "name": "seqkit_stats",
-            "description": "Generate FASTQ statistics using seqkit stats command",
-            "method": "POST",
-            "path": "/seqkit/stats",
-            "input_schema": get_tool_schema(SeqkitStatsRequest),
-            "output_schema": get_tool_schema(SeqkitStatsResponse),
-            "tags": ["seqkit", "statistics", "fastq"]
-        },
-        {
-            "name": "seqkit_command", 
-            "description": "Run custom seqkit commands on FASTQ files",
-            "method": "POST",
-            "path": "/seqkit/command",
-            "input_schema": get_tool_schema(SeqkitCommandRequest),
-            "output_schema": get_tool_schema(SeqkitCommandResponse),
-            "tags": ["seqkit", "command", "fastq"]
-        }
-    ]
-    
-    return tools
+    return _TOOLS
 
 
 def get_tool_by_name(name: str) -> Dict[str, Any]:
     """Get a specific tool by name"""
-    tools = get_tools()
-    for tool in tools:
-        if tool["name"] == name:
-            return tool
-    raise ValueError(f"Tool '{name}' not found")
+    try:
+        return _TOOLS_BY_NAME[name]
+    except KeyError:
+        raise ValueError(f"Tool '{name}' not found")
 
 
 def get_tools_summary() -> Dict[str, Any]:
     """Get summary information about available tools"""
-    tools = get_tools()
-    
-    return {
-        "total_tools": len(tools),
-        "tools_by_category": {
-            "conversion": len([t for t in tools if "conversion" in t["tags"]]),
-            "manipulation": len([t for t in tools if "manipulation" in t["tags"]]),
-            "seqkit": len([t for t in tools if "seqkit" in t["tags"]])
-        },
-        "supported_formats": {
-            "input": ["string", "base64"],
-            "sequence_types": ["FASTA", "FASTQ", "GenBank"]
-        }
-    }
\ No newline at end of file
+    return _TOOLS_SUMMARY
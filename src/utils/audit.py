@@ -0,0 +1,90 @@
+"""
+Audit bookkeeping for request handlers.
+
+``audited`` wraps a handler body: it times the block, records exactly one
+audit event for its outcome and turns known exceptions into HTTP errors.
+"""
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple, Type
+
+from fastapi import HTTPException
+
+from src.utils import audit_queue
+from src.utils.logging import audit_logger, logger
+from src.utils.timing import elapsed_ms
+
+
+# Exception type -> (status code, log function, error message prefix)
+ErrorMap = Dict[Type[Exception], Tuple[int, Callable[..., None], str]]
+
+UNEXPECTED_ERR = (500, logger.error, "Unexpected error")
+
+# Exception text (e.g. seqkit stderr) kept in error messages and audit entries
+MAX_ERROR_MESSAGE_LENGTH = 512
+
+
+class AuditRecord:
+    """Handle yielded by ``audited`` for timing and the result summary."""
+
+    __slots__ = ("t0", "result_summary")
+
+    def __init__(self):
+        self.t0 = time.perf_counter_ns()
+        self.result_summary: Dict[str, Any] = {}
+
+    def set_result(self, summary: Dict[str, Any]):
+        self.result_summary = summary
+
+    def elapsed_ms(self) -> float:
+        return elapsed_ms(self.t0)
+
+
+def _record(operation, endpoint, params, success, execution_time, result_summary, error_message=None):
+    if audit_logger.should_log(success=success):
+        audit_queue.enqueue({
+            "operation": operation,
+            "endpoint": endpoint,
+            "parameters": params,
+            "success": success,
+            "execution_time_ms": execution_time,
+            "result_summary": result_summary,
+            "error_message": error_message,
+        })
+
+
+@asynccontextmanager
+async def audited(
+    operation: str,
+    endpoint: str,
+    params: Dict[str, Any],
+    err_map: Optional[ErrorMap] = None,
+) -> AsyncIterator[AuditRecord]:
+    """
+    Record one audit event for the wrapped block.
+
+    Exceptions whose exact type is in ``err_map`` become an ``HTTPException``
+    with the mapped status; anything else becomes a 500 with a generic detail.
+    An ``HTTPException`` raised in the block is recorded and passed through.
+    """
+    record = AuditRecord()
+
+    try:
+        yield record
+    except HTTPException as e:
+        _record(
+            operation, endpoint, params, False, record.elapsed_ms(), {},
+            str(e.detail)[:MAX_ERROR_MESSAGE_LENGTH]
+        )
+        raise
+    except Exception as e:
+        status_code, log, prefix = (err_map or {}).get(type(e), UNEXPECTED_ERR)
+        error_msg = f"{prefix}: {str(e)[:MAX_ERROR_MESSAGE_LENGTH]}"
+
+        _record(operation, endpoint, params, False, record.elapsed_ms(), {}, error_msg)
+
+        log(error_msg)
+        detail = error_msg if status_code != 500 else "Internal server error"
+        raise HTTPException(status_code=status_code, detail=detail)
+    else:
+        _record(operation, endpoint, params, True, record.elapsed_ms(), record.result_summary)
@@ -0,0 +1,128 @@
+"""
+Buffered audit logging.
+
+Request handlers push lightweight events onto an asyncio queue and a single
+background task flushes them into the audit logger in batches. When no
+consumer is running (e.g. the app was used without its lifespan), events are
+written straight through so nothing is lost.
+"""
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+
+from src.utils.logging import audit_logger, logger
+
+
+QUEUE_MAXSIZE = 10_000
+BATCH_SIZE = 100
+FLUSH_INTERVAL_S = 0.05
+
+_queue: Optional[asyncio.Queue] = None
+_consumer: Optional[asyncio.Task] = None
+_pending: List[Dict[str, Any]] = []
+
+
+def enqueue(event: Dict[str, Any]):
+    """
+    Queue an audit event for batched logging.
+
+    The event holds the keyword arguments of ``audit_logger.log_operation``.
+    On overflow the oldest queued event is dropped to make room.
+    """
+    event.setdefault("logged_at", time.time())
+
+    if _queue is None:
+        audit_logger.log_operation_batch([event])
+        return
+
+    try:
+        _queue.put_nowait(event)
+    except asyncio.QueueFull:
+        try:
+            _queue.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+        _queue.put_nowait(event)
+
+
+def _write_pending():
+    global _pending
+
+    batch, _pending = _pending, []
+    try:
+        audit_logger.log_operation_batch(batch)
+    except Exception as e:
+        logger.error("Failed to flush audit events: %s", e)
+
+
+def flush():
+    """Write every pending event to the audit logger immediately."""
+    if _queue is None:
+        return
+
+    while True:
+        try:
+            _pending.append(_queue.get_nowait())
+        except asyncio.QueueEmpty:
+            break
+
+    _write_pending()
+
+
+async def _collect(queue: asyncio.Queue):
+    loop = asyncio.get_running_loop()
+
+    _pending.append(await queue.get())
+    deadline = loop.time() + FLUSH_INTERVAL_S
+
+    while len(_pending) < BATCH_SIZE:
+        try:
+            _pending.append(queue.get_nowait())
+            continue
+        except asyncio.QueueEmpty:
+            pass
+
+        timeout = deadline - loop.time()
+        if timeout <= 0:
+            break
+        try:
+            _pending.append(await asyncio.wait_for(queue.get(), timeout))
+        except asyncio.TimeoutError:
+            break
+
+
+async def _consume(queue: asyncio.Queue):
+    while True:
+        try:
+            await _collect(queue)
+        finally:
+            _write_pending()
+
+
+def start():
+    """Start the background consumer on the running event loop."""
+    global _queue, _consumer
+
+    if _consumer is not None:
+        return
+
+    _queue = asyncio.Queue(maxsize=QUEUE_MAXSIZE)
+    _consumer = asyncio.create_task(_consume(_queue))
+
+
+async def stop():
+    """Stop the background consumer and flush anything still queued."""
+    global _queue, _consumer
+
+    if _consumer is None:
+        return
+
+    _consumer.cancel()
+    try:
+        await _consumer
+    except asyncio.CancelledError:
+        pass
+
+    flush()
+    _queue = None
+    _consumer = None
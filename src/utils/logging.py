@@ -1,12 +1,16 @@
 import logging
 import json
+import math
+import os
+from random import random
 from datetime import datetime
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, asdict
+from typing import Deque, Dict, Any, List, Optional, Set
+from collections import Counter, deque
+from dataclasses import dataclass
 from threading import Lock
 
 
-@dataclass
+@dataclass(slots=True)
 class OperationLog:
     timestamp: str
     operation: str
@@ -16,13 +20,38 @@ class OperationLog:
     execution_time_ms: float
     result_summary: Dict[str, Any]
     error_message: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow dict of the fields (``asdict`` would deep-copy each one)."""
+        return {
+            "timestamp": self.timestamp,
+            "operation": self.operation,
+            "endpoint": self.endpoint,
+            "parameters": self.parameters,
+            "success": self.success,
+            "execution_time_ms": self.execution_time_ms,
+            "result_summary": self.result_summary,
+            "error_message": self.error_message
+        }
 
 
 class InMemoryLogger:
-    def __init__(self, max_logs: int = 1000):
-        self.logs: List[OperationLog] = []
+    def __init__(self, max_logs: int = 1000, enabled: bool = True, sample_rate: float = 1.0):
+        self.logs: Deque[OperationLog] = deque(maxlen=max_logs)
         self.max_logs = max_logs
+        self.enabled = enabled
+        self.sample_rate = min(max(sample_rate, 0.0), 1.0)
         self._lock = Lock()
+        self._operation_counts: Counter = Counter()
+        self._success_count = 0
+        # Whole microseconds, so adding and evicting entries cannot drift
+        self._execution_time_us_sum = 0
+    
+    def should_log(self, success: bool) -> bool:
+        """Whether to record an operation; failures are always kept, successes are sampled."""
+        if not self.enabled:
+            return False
+        return not success or self.sample_rate >= 1.0 or random() < self.sample_rate
     
     def log_operation(
         self,
@@ -34,13 +63,13 @@ class InMemoryLogger:
         result_summary: Dict[str, Any],
         error_message: Optional[str] = None
     ):
-        timestamp = datetime.utcnow().isoformat() + "Z"
+        if not self.enabled:
+            return
         
-        log_entry = OperationLog(
-            timestamp=timestamp,
+        log_entry = self._build_entry(
             operation=operation,
             endpoint=endpoint,
-            parameters=self._sanitize_parameters(parameters),
+            parameters=parameters,
             success=success,
             execution_time_ms=execution_time_ms,
             result_summary=result_summary,
@@ -48,10 +77,67 @@ class InMemoryLogger:
         )
         
         with self._lock:
-            self.logs.append(log_entry)
-            
-            if len(self.logs) > self.max_logs:
-                self.logs = self.logs[-self.max_logs:]
+            self._append_entries([log_entry])
+    
+    def log_operation_batch(self, events: List[Dict[str, Any]]):
+        """Record several operations at once, taking the lock a single time.
+
+        Each event holds the keyword arguments accepted by ``log_operation``,
+        optionally with a ``logged_at`` epoch timestamp taken when the event
+        was produced.
+        """
+        if not events or not self.enabled:
+            return
+        
+        entries = [self._build_entry(**event) for event in events]
+        
+        with self._lock:
+            self._append_entries(entries)
+    
+    def _append_entries(self, entries: List[OperationLog]):
+        # Caller must hold self._lock; a full deque drops its oldest entry on
+        # append, so uncount that entry first.
+        for entry in entries:
+            if len(self.logs) == self.logs.maxlen:
+                self._count_entry(self.logs[0], -1)
+            self.logs.append(entry)
+            self._count_entry(entry, 1)
+    
+    def _count_entry(self, entry: OperationLog, sign: int):
+        # Caller must hold self._lock
+        self._operation_counts[entry.operation] += sign
+        if not self._operation_counts[entry.operation]:
+            del self._operation_counts[entry.operation]
+        if entry.success:
+            self._success_count += sign
+        self._execution_time_us_sum += sign * round(entry.execution_time_ms * 1000)
+    
+    def _build_entry(
+        self,
+        operation: str,
+        endpoint: str,
+        parameters: Dict[str, Any],
+        success: bool,
+        execution_time_ms: float,
+        result_summary: Dict[str, Any],
+        error_message: Optional[str] = None,
+        logged_at: Optional[float] = None
+    ) -> OperationLog:
+        if logged_at is None:
+            moment = datetime.utcnow()
+        else:
+            moment = datetime.utcfromtimestamp(logged_at)
+        
+        return OperationLog(
+            timestamp=moment.isoformat() + "Z",
+            operation=operation,
+            endpoint=endpoint,
+            parameters=self._sanitize_parameters(parameters),
+            success=success,
+            execution_time_ms=execution_time_ms,
+            result_summary=result_summary,
+            error_message=error_message
+        )
     
     def get_logs(
         self,
@@ -59,27 +145,28 @@ class InMemoryLogger:
         operation: Optional[str] = None,
         success_only: Optional[bool] = None
     ) -> List[Dict[str, Any]]:
+        result = []
         with self._lock:
-            filtered_logs = self.logs.copy()
-        
-        if operation:
-            filtered_logs = [log for log in filtered_logs if log.operation == operation]
-        
-        if success_only is not None:
-            filtered_logs = [log for log in filtered_logs if log.success == success_only]
-        
-        filtered_logs.sort(key=lambda x: x.timestamp, reverse=True)
-        
-        if limit:
-            filtered_logs = filtered_logs[:limit]
+            # Entries are appended in time order, so newest-first is just reversed
+            for log in reversed(self.logs):
+                if operation and log.operation != operation:
+                    continue
+                if success_only is not None and log.success != success_only:
+                    continue
+                result.append(log.to_dict())
+                if limit and len(result) >= limit:
+                    break
         
-        return [asdict(log) for log in filtered_logs]
+        return result
     
     def get_stats(self) -> Dict[str, Any]:
         with self._lock:
-            logs = self.logs.copy()
+            total_ops = len(self.logs)
+            successful_ops = self._success_count
+            operations_by_type = dict(self._operation_counts)
+            total_execution_time_us = self._execution_time_us_sum
         
-        if not logs:
+        if not total_ops:
             return {
                 "total_operations": 0,
                 "successful_operations": 0,
@@ -88,31 +175,29 @@ class InMemoryLogger:
                 "average_execution_time_ms": 0
             }
         
-        total_ops = len(logs)
-        successful_ops = sum(1 for log in logs if log.success)
-        failed_ops = total_ops - successful_ops
-        
-        operations_by_type = {}
-        total_execution_time = 0
-        
-        for log in logs:
-            operations_by_type[log.operation] = operations_by_type.get(log.operation, 0) + 1
-            total_execution_time += log.execution_time_ms
-        
-        avg_execution_time = total_execution_time / total_ops if total_ops > 0 else 0
-        
         return {
             "total_operations": total_ops,
             "successful_operations": successful_ops,
-            "failed_operations": failed_ops,
-            "success_rate": successful_ops / total_ops if total_ops > 0 else 0,
+            "failed_operations": total_ops - successful_ops,
+            "success_rate": successful_ops / total_ops,
             "operations_by_type": operations_by_type,
-            "average_execution_time_ms": round(avg_execution_time, 2)
+            "average_execution_time_ms": round(total_execution_time_us / total_ops / 1000, 2)
         }
     
+    def total_count(self) -> int:
+        return len(self.logs)
+    
+    def get_operations(self) -> Set[str]:
+        """Distinct operation types currently held in the log buffer."""
+        with self._lock:
+            return set(self._operation_counts)
+    
     def clear_logs(self):
         with self._lock:
             self.logs.clear()
+            self._operation_counts.clear()
+            self._success_count = 0
+            self._execution_time_us_sum = 0
     
     def _sanitize_parameters(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         sanitized = {}
@@ -138,5 +223,25 @@ def setup_logging():
     return logging.getLogger(__name__)
 
 
+def _env_sample_rate(name: str = "AUDIT_SAMPLE_RATE", default: float = 1.0) -> float:
+    """Sample rate from the environment, clamped to [0, 1]; bad values fall back to ``default``."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    
+    try:
+        rate = float(value)
+    except ValueError:
+        rate = math.nan
+    
+    if math.isnan(rate):
+        logger.warning("Ignoring invalid %s=%r; using %s", name, value, default)
+        return default
+    return min(max(rate, 0.0), 1.0)
+
+
 logger = setup_logging()
-audit_logger = InMemoryLogger()
\ No newline at end of file
+audit_logger = InMemoryLogger(
+    enabled=os.environ.get("AUDIT_LOG_ENABLED", "true").lower() not in ("0", "false", "no"),
+    sample_rate=_env_sample_rate()
+)
\ No newline at end of file
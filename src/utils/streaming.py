@@ -0,0 +1,29 @@
+"""
+Helpers for streaming sequence output instead of embedding it in JSON.
+"""
+from typing import Iterator
+
+from fastapi.responses import StreamingResponse
+
+
+STREAM_CHUNK_SIZE = 64 * 1024
+FASTA_MEDIA_TYPE = "text/x-fasta"
+
+
+def iter_chunks(text: str, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[str]:
+    for i in range(0, len(text), chunk_size):
+        yield text[i:i + chunk_size]
+
+
+def fasta_stream_response(fasta_content: str, execution_time_ms: float) -> StreamingResponse:
+    """
+    Stream FASTA output as plain text, with run metadata in response headers.
+    """
+    return StreamingResponse(
+        iter_chunks(fasta_content),
+        media_type=FASTA_MEDIA_TYPE,
+        headers={
+            "X-Execution-Time-Ms": str(round(execution_time_ms, 2)),
+            "X-Output-Length": str(len(fasta_content)),
+        },
+    )
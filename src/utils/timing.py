@@ -0,0 +1,9 @@
+"""
+Timing helpers for request handlers.
+"""
+import time
+
+
+def elapsed_ms(t0: int) -> float:
+    """Milliseconds elapsed since ``t0``, a ``time.perf_counter_ns()`` reading."""
+    return (time.perf_counter_ns() - t0) / 1e6
@@ -1,6 +1,31 @@
-import base64
+import io
 import re
-from typing import Optional, Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+
+MAX_CONTENT_SIZE_MB = 50
+MAX_CONTENT_LENGTH = MAX_CONTENT_SIZE_MB * 1024 * 1024
+# Whole request bodies may exceed the content limit by JSON escaping and the
+# remaining fields; this is only a coarse guard checked before reading.
+MAX_REQUEST_LENGTH = 2 * MAX_CONTENT_LENGTH
+MAX_BATCH_ITEMS = 1000
+# Raw (non-JSON) bodies are streamed to seqkit rather than held in memory
+MAX_RAW_BODY_LENGTH = 1024 * 1024 * 1024
+# Leading characters of FASTQ content whose records get a structural check
+FASTQ_QUICK_CHECK_LENGTH = 64 * 1024
+# Sequence lines joined into one alphabet check by the full validators
+SEQUENCE_CHECK_BATCH_LINES = 4096
+
+
+_SEQUENCE_RE = re.compile(r'[ATCGRYSWKMBDHVN-]+', re.IGNORECASE)
+# Same alphabet as bytes, for translate-based checks
+IUPAC_DNA_BYTES = b"ATCGRYSWKMBDHVN-atcgryswkmbdhvn"
+# Deletes the alphabet from a str: anything left over is an invalid character
+_IUPAC_DELETE_TABLE = str.maketrans("", "", IUPAC_DNA_BYTES.decode("ascii"))
+_FASTA_START_RE = re.compile(r'\s*>')
+_LOCUS_RE = re.compile(r'LOCUS', re.IGNORECASE)
+_ORIGIN_RE = re.compile(r'ORIGIN', re.IGNORECASE)
+_INVALID_ID_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
 
 
 class ValidationError(Exception):
@@ -21,17 +46,11 @@ def validate_output_format(output_format: str) -> str:
     return output_format
 
 
-def validate_base64_content(content: str) -> bool:
-    try:
-        base64.b64decode(content)
-        return True
-    except Exception:
-        return False
-
-
-def validate_content_size(content: str, max_size_mb: int = 50) -> bool:
+def validate_content_size(content: str, max_size_mb: int = MAX_CONTENT_SIZE_MB) -> bool:
     max_size_bytes = max_size_mb * 1024 * 1024
-    content_size = len(content.encode('utf-8'))
+    # ASCII (all real sequence data) is one byte per character; only other
+    # text pays for an encoded copy
+    content_size = len(content) if content.isascii() else len(content.encode('utf-8'))
     
     if content_size > max_size_bytes:
         raise ValidationError(f"Content size ({content_size} bytes) exceeds maximum allowed size ({max_size_bytes} bytes)")
@@ -39,70 +58,154 @@ def validate_content_size(content: str, max_size_mb: int = 50) -> bool:
     return True
 
 
+def _first_invalid_sequence_line(
+    numbered_lines: Iterable[Tuple[int, str]]
+) -> Tuple[int, Optional[Tuple[int, str]]]:
+    """
+    Check ``(line number, sequence line)`` pairs against the IUPAC alphabet.
+
+    Lines are checked a batch at a time with one ``str.translate`` over the
+    joined batch, so only ``SEQUENCE_CHECK_BATCH_LINES`` lines are held at
+    once. Returns the number of lines checked and the first invalid pair
+    (or ``None``).
+    """
+    checked = 0
+    batch: List[Tuple[int, str]] = []
+
+    def invalid_in_batch() -> Optional[Tuple[int, str]]:
+        if "".join(line for _, line in batch).translate(_IUPAC_DELETE_TABLE):
+            return next(item for item in batch if item[1].translate(_IUPAC_DELETE_TABLE))
+        return None
+
+    for item in numbered_lines:
+        batch.append(item)
+        checked += 1
+        if len(batch) == SEQUENCE_CHECK_BATCH_LINES:
+            invalid = invalid_in_batch()
+            if invalid:
+                return checked, invalid
+            batch.clear()
+
+    return checked, invalid_in_batch()
+
+
+def _fasta_sequence_lines(lines: Iterable[str]) -> Iterator[Tuple[int, str]]:
+    for line_number, line in enumerate(lines, 2):
+        line = line.strip()
+        if line and not line.startswith('>'):
+            yield line_number, line
+
+
+def _fastq_sequence_lines(lines: Iterable[str]) -> Iterator[Tuple[int, str]]:
+    """Check each 4-line record's structure, yielding its sequence line."""
+    for i, (header, seq_line, qual_header, qual_line) in enumerate(zip(lines, lines, lines, lines)):
+        line_number = 4 * i + 1
+        
+        if not header.startswith('@'):
+            raise ValidationError(f"Line {line_number}: FASTQ header must start with '@'")
+        
+        if not qual_header.startswith('+'):
+            raise ValidationError(f"Line {line_number + 2}: FASTQ quality header must start with '+'")
+        
+        seq_line = seq_line.strip()
+        qual_line = qual_line.strip()
+        
+        if len(seq_line) != len(qual_line):
+            raise ValidationError(f"Record starting at line {line_number}: sequence and quality lengths don't match")
+        
+        if not seq_line:
+            raise ValidationError(f"Line {line_number + 1}: Invalid sequence characters found")
+        
+        yield line_number + 1, seq_line
+
+
 def validate_fasta_format(content: str) -> bool:
-    if not content.strip():
+    content = content.strip()
+    if not content:
         raise ValidationError("Empty content provided")
     
-    lines = content.strip().split('\n')
-    if not lines[0].startswith('>'):
+    # Walk the lines instead of splitting the content into a list of them
+    lines = io.StringIO(content)
+    if not lines.readline().startswith('>'):
         raise ValidationError("FASTA content must start with a header line (>)")
     
-    has_sequence = False
-    for line in lines[1:]:
-        line = line.strip()
-        if not line:
-            continue
-        if line.startswith('>'):
-            continue
-        if re.match(r'^[ATCGRYSWKMBDHVN-]+$', line.upper()):
-            has_sequence = True
-        else:
-            raise ValidationError(f"Invalid sequence characters found: {line}")
-    
-    if not has_sequence:
+    checked, invalid = _first_invalid_sequence_line(_fasta_sequence_lines(lines))
+    if invalid:
+        raise ValidationError(f"Invalid sequence characters found: {invalid[1]}")
+    
+    if not checked:
         raise ValidationError("No valid sequence data found in FASTA content")
     
     return True
 
 
 def validate_fastq_format(content: str) -> bool:
-    if not content.strip():
+    content = content.strip()
+    if not content:
         raise ValidationError("Empty content provided")
     
-    lines = content.strip().split('\n')
-    if len(lines) < 4:
+    line_count = content.count('\n') + 1
+    if line_count < 4:
         raise ValidationError("FASTQ content must have at least 4 lines per record")
     
-    if len(lines) % 4 != 0:
+    if line_count % 4 != 0:
         raise ValidationError("FASTQ content must have complete 4-line records")
     
-    for i in range(0, len(lines), 4):
-        if not lines[i].startswith('@'):
-            raise ValidationError(f"Line {i+1}: FASTQ header must start with '@'")
-        
-        if not lines[i+2].startswith('+'):
-            raise ValidationError(f"Line {i+3}: FASTQ quality header must start with '+'")
-        
-        seq_line = lines[i+1].strip()
-        qual_line = lines[i+3].strip()
-        
-        if len(seq_line) != len(qual_line):
-            raise ValidationError(f"Record starting at line {i+1}: sequence and quality lengths don't match")
-        
-        if not re.match(r'^[ATCGRYSWKMBDHVN-]+$', seq_line.upper()):
-            raise ValidationError(f"Line {i+2}: Invalid sequence characters found")
+    # Walk the records instead of splitting the content into a list of lines
+    _, invalid = _first_invalid_sequence_line(_fastq_sequence_lines(io.StringIO(content)))
+    if invalid:
+        raise ValidationError(f"Line {invalid[0]}: Invalid sequence characters found")
     
     return True
 
 
+def fastq_format_quick_check(content: str) -> bool:
+    """
+    Cheap check that ``content`` looks like well-formed FASTQ.
+
+    Only the complete records within the first ``FASTQ_QUICK_CHECK_LENGTH``
+    characters are inspected, plus a whole-content line count (a single C
+    level scan). ``False`` means the content is unusual or malformed and
+    should go through ``validate_fastq_format``; content that passes is left
+    for seqkit to reject if a later record is broken.
+    """
+    if not content.startswith("@"):
+        return False
+
+    head = content[:FASTQ_QUICK_CHECK_LENGTH]
+    if "\r" in head:
+        return False
+
+    lines = head.split("\n")
+    if len(head) < len(content) or lines[-1] == "":
+        # Drop the cut-off (or empty trailing) line
+        lines.pop()
+    records = len(lines) // 4
+    if records == 0:
+        return False
+
+    for i in range(0, records * 4, 4):
+        if lines[i][:1] != "@" or lines[i + 2][:1] != "+":
+            return False
+        if len(lines[i + 1]) != len(lines[i + 3]):
+            return False
+        if not _SEQUENCE_RE.fullmatch(lines[i + 1]):
+            return False
+
+    line_count = content.count("\n") + (not content.endswith("\n"))
+    return line_count % 4 == 0
+
+
 def validate_genbank_format(content: str) -> bool:
     if not content.strip():
         raise ValidationError("Empty content provided")
     
-    if "LOCUS" not in content and "locus" not in content.lower():
+    # Exact-case substring scans first; the case-insensitive search is only the
+    # fallback, and neither makes a lowercased copy of the content
+    if "LOCUS" not in content and not _LOCUS_RE.search(content):
         raise ValidationError("GenBank content must contain LOCUS line")
     
-    if "ORIGIN" not in content and "origin" not in content.lower():
+    if "ORIGIN" not in content and not _ORIGIN_RE.search(content):
         raise ValidationError("GenBank content must contain ORIGIN section")
     
     if "//" not in content:
@@ -133,7 +236,7 @@ def validate_sequence_id(sequence_id: str) -> str:
     if len(sequence_id) > 255:
         raise ValidationError("Sequence ID cannot exceed 255 characters")
     
-    if re.search(r'[<>:"/\\|?*]', sequence_id):
+    if _INVALID_ID_CHARS_RE.search(sequence_id):
         raise ValidationError("Sequence ID contains invalid characters")
     
     return sequence_id
@@ -0,0 +1,21 @@
+"""
+Shared pytest fixtures.
+"""
+import httpx
+import pytest
+
+from src.main import app
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    # Session scope so the session-scoped async fixtures share one event loop
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+async def aclient():
+    """One in-process async client for the session, inside a single app lifespan."""
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver") as client:
+            yield client
@@ -1,9 +1,11 @@
 import unittest
 import os
 import base64
+import json
 from fastapi.testclient import TestClient
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 from src.main import app
+from src.utils.logging import InMemoryLogger, _env_sample_rate
 
 
 class TestAPIIntegration(unittest.TestCase):
@@ -41,6 +43,28 @@ class TestAPIIntegration(unittest.TestCase):
         self.assertIn("biopython", data["services"])
         self.assertTrue(data["services"]["biopython"])
     
+    def test_openapi_refs_resolve(self):
+        response = self.client.get("/openapi.json")
+        
+        self.assertEqual(response.status_code, 200)
+        spec = response.json()
+        schemas = spec["components"]["schemas"]
+        
+        def refs(node):
+            if isinstance(node, dict):
+                for key, value in node.items():
+                    if key == "$ref":
+                        yield value
+                    else:
+                        yield from refs(value)
+            elif isinstance(node, list):
+                for value in node:
+                    yield from refs(value)
+        
+        for ref in refs(spec):
+            self.assertTrue(ref.startswith("#/components/schemas/"), ref)
+            self.assertIn(ref.rsplit("/", 1)[1], schemas)
+    
     def test_convert_genbank_to_fasta_string_format(self):
         response = self.client.post(
             "/convert/genbank-to-fasta",
@@ -96,6 +120,50 @@ class TestAPIIntegration(unittest.TestCase):
         data = response.json()
         self.assertIn("error", data)
     
+    @patch('src.api.dependencies.MAX_CONTENT_LENGTH', 8)
+    def test_convert_genbank_to_fasta_content_limit_in_bytes(self):
+        # 6 characters, but 12 bytes of UTF-8
+        response = self.client.post(
+            "/convert/genbank-to-fasta",
+            json={"content": "\u00e9" * 6, "input_format": "string"}
+        )
+        
+        self.assertEqual(response.status_code, 422)
+    
+    def test_convert_genbank_to_fasta_stream(self):
+        response = self.client.post(
+            "/convert/genbank-to-fasta/stream",
+            json={
+                "content": self.sample_genbank,
+                "input_format": "string"
+            }
+        )
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/x-fasta"))
+        self.assertIn("x-execution-time-ms", response.headers)
+        self.assertEqual(int(response.headers["x-output-length"]), len(response.text))
+        self.assertTrue(response.text.startswith('>'))
+    
+    def test_convert_genbank_to_fasta_batch(self):
+        response = self.client.post(
+            "/convert/genbank-to-fasta/batch",
+            json={
+                "items": [
+                    {"content": self.sample_genbank},
+                    {"content": self.sample_genbank, "include_summary": True}
+                ]
+            }
+        )
+        
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        
+        self.assertEqual(len(data["results"]), 2)
+        self.assertTrue(data["results"][0]["fasta_content"].startswith('>'))
+        self.assertIsNone(data["results"][0]["conversion_summary"])
+        self.assertEqual(data["results"][1]["conversion_summary"]["record_count"], 1)
+    
     def test_convert_formats_endpoint(self):
         response = self.client.get("/convert/formats")
         
@@ -129,6 +197,34 @@ class TestAPIIntegration(unittest.TestCase):
         self.assertIn("_rc", data["fasta_content"])
         self.assertIsNotNone(data["manipulation_summary"])
     
+    def test_manipulate_reverse_complement_stream(self):
+        response = self.client.post(
+            "/manipulate/reverse-complement/stream",
+            json={
+                "content": self.sample_fasta,
+                "input_format": "string"
+            }
+        )
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/x-fasta"))
+        self.assertTrue(response.text.startswith('>'))
+        self.assertIn("_rc", response.text)
+    
+    def test_manipulate_reverse_complement_batch(self):
+        response = self.client.post(
+            "/manipulate/reverse-complement/batch",
+            json={
+                "items": [
+                    {"content": self.sample_fasta},
+                    {"content": ">bad\nACGTXYZ\n"}
+                ]
+            }
+        )
+        
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("item 1", response.json()["error"])
+    
     def test_manipulate_extract_subsequence(self):
         response = self.client.post(
             "/manipulate/extract-subsequence",
@@ -180,12 +276,14 @@ class TestAPIIntegration(unittest.TestCase):
         self.assertIn("input_formats", data)
         self.assertIn("features", data)
     
-    @patch('src.core.seqkit_wrapper.validate_seqkit_installation')
-    @patch('src.core.seqkit_wrapper.subprocess.run')
-    def test_seqkit_stats_success(self, mock_run, mock_validate):
-        mock_validate.return_value = True
-        mock_stats = '[{"file": "test.fastq", "format": "FASTQ", "type": "DNA", "num_seqs": 3}]'
-        mock_run.return_value = MagicMock(returncode=0, stdout=mock_stats)
+    @patch('src.api.seqkit.run_seqkit_stats_batched', new_callable=AsyncMock)
+    @patch('src.api.seqkit.get_seqkit_status')
+    def test_seqkit_stats_success(self, mock_status, mock_stats):
+        mock_status.return_value = (True, "seqkit v2.0.0")
+        mock_stats.return_value = (
+            {"file": "-", "format": "FASTQ", "type": "DNA", "num_seqs": "3"},
+            False
+        )
         
         response = self.client.post(
             "/seqkit/stats",
@@ -204,11 +302,15 @@ class TestAPIIntegration(unittest.TestCase):
         self.assertIn("execution_time_ms", data)
         
         self.assertTrue(data["success"])
-        self.assertIsInstance(data["statistics"], list)
+        self.assertEqual(data["statistics"]["num_seqs"], "3")
+        mock_stats.assert_awaited_once_with(
+            self.sample_fastq, input_format="string", output_format="json"
+        )
     
-    @patch('src.core.seqkit_wrapper.validate_seqkit_installation')
-    def test_seqkit_stats_unavailable(self, mock_validate):
-        mock_validate.return_value = False
+    @patch('src.api.seqkit.run_seqkit_stats_batched', new_callable=AsyncMock)
+    @patch('src.api.seqkit.get_seqkit_status')
+    def test_seqkit_stats_unavailable(self, mock_status, mock_stats):
+        mock_status.return_value = (False, None)
         
         response = self.client.post(
             "/seqkit/stats",
@@ -221,6 +323,95 @@ class TestAPIIntegration(unittest.TestCase):
         self.assertEqual(response.status_code, 503)
         data = response.json()
         self.assertIn("error", data)
+        mock_stats.assert_not_awaited()
+    
+    @patch('src.api.seqkit.get_seqkit_status')
+    def test_seqkit_stats_raw(self, mock_status):
+        mock_status.return_value = (True, "seqkit v2.0.0")
+        received = []
+        
+        async def fake_stream(chunks, input_format="string", output_format="json"):
+            async for chunk in chunks:
+                received.append(chunk)
+            return {"input_format": input_format, "output_format": output_format}
+        
+        with patch('src.api.seqkit.run_seqkit_stats_stream', fake_stream):
+            response = self.client.post(
+                "/seqkit/stats/raw?output_format=text",
+                content=self.sample_fastq.encode(),
+                headers={"X-Input-Format": "base64"}
+            )
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json()["statistics"],
+            {"input_format": "base64", "output_format": "text"}
+        )
+        self.assertEqual(b"".join(received), self.sample_fastq.encode())
+    
+    @patch('src.api.seqkit.MAX_RAW_BODY_LENGTH', 16)
+    @patch('src.api.seqkit.get_seqkit_status')
+    def test_seqkit_stats_raw_too_large(self, mock_status):
+        mock_status.return_value = (True, "seqkit v2.0.0")
+        
+        async def fake_stream(chunks, input_format="string", output_format="json"):
+            async for _ in chunks:
+                pass
+            return {}
+        
+        def chunked_body():
+            yield self.sample_fastq.encode()
+        
+        # Chunked, so only the streamed byte count can catch the size
+        with patch('src.api.seqkit.run_seqkit_stats_stream', fake_stream):
+            response = self.client.post("/seqkit/stats/raw", content=chunked_body())
+        
+        self.assertEqual(response.status_code, 413)
+    
+    @patch('src.api.seqkit.run_seqkit_stats')
+    @patch('src.api.seqkit.get_seqkit_status')
+    def test_seqkit_stats_batches(self, mock_status, mock_stats):
+        mock_status.return_value = (True, "seqkit v2.0.0")
+        mock_stats.return_value = {"num_seqs": "3"}
+        body = "\n".join([
+            json.dumps({"content": self.sample_fastq}),
+            "not json",
+            json.dumps({"content": self.sample_fastq, "output_format": "text"}),
+        ])
+        
+        with patch('src.api.seqkit.audit_queue.enqueue') as enqueue:
+            response = self.client.post("/seqkit/batches", content=body)
+        
+        self.assertEqual(response.status_code, 200)
+        results = sorted(
+            (json.loads(line) for line in response.text.splitlines()),
+            key=lambda result: result["index"]
+        )
+        self.assertEqual([result["success"] for result in results], [True, False, True])
+        self.assertEqual(results[0]["statistics"], {"num_seqs": "3"})
+        
+        status = self.client.get(f"/seqkit/batches/{response.headers['X-Batch-Job-Id']}").json()
+        self.assertEqual(status["status"], "completed")
+        self.assertEqual((status["total"], status["failed"]), (3, 1))
+        
+        entry = enqueue.call_args[0][0]
+        self.assertFalse(entry["success"])
+        self.assertEqual(entry["result_summary"]["failed_items"], 1)
+        self.assertEqual(entry["error_message"], "1 of 3 items failed")
+    
+    @patch('src.api.seqkit.MAX_REQUEST_LENGTH', 64)
+    @patch('src.api.seqkit.get_seqkit_status')
+    def test_seqkit_stats_batches_line_too_long(self, mock_status):
+        mock_status.return_value = (True, "seqkit v2.0.0")
+        
+        def chunked_body():
+            yield b'{"content": "'
+            yield b"A" * 100
+            yield b'"}\n'
+        
+        response = self.client.post("/seqkit/batches", content=chunked_body())
+        
+        self.assertEqual(response.status_code, 413)
     
     def test_seqkit_info_endpoint(self):
         response = self.client.get("/seqkit/info")
@@ -272,6 +463,19 @@ class TestAPIIntegration(unittest.TestCase):
         self.assertIn("successful_operations", stats)
         self.assertIn("failed_operations", stats)
     
+    def test_logs_stats_average_after_eviction(self):
+        audit_log = InMemoryLogger(max_logs=2)
+        for execution_time_ms in (0.1, 0.2, 0.3, 0.7):
+            audit_log.log_operation("op", "/op", {}, True, execution_time_ms, {})
+        
+        self.assertEqual(audit_log.get_stats()["average_execution_time_ms"], 0.5)
+        self.assertEqual(audit_log._execution_time_us_sum, 1000)
+    
+    def test_audit_sample_rate_from_env(self):
+        for value, expected in (("0.25", 0.25), ("5", 1.0), ("-1", 0.0), ("often", 1.0), ("nan", 1.0)):
+            with patch.dict(os.environ, {"AUDIT_SAMPLE_RATE": value}):
+                self.assertEqual(_env_sample_rate(), expected)
+    
     def test_logs_operations_endpoint(self):
         response = self.client.get("/logs/operations")
         
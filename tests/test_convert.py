@@ -1,16 +1,25 @@
+import asyncio
 import unittest
 import os
 import base64
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import patch
+from fastapi import HTTPException
+from src.core import workers
 from src.core.converters import genbank_to_fasta, get_conversion_summary, ConversionError
+from src.utils.validators import ValidationError, validate_genbank_format
 
 
 class TestConverters(unittest.TestCase):
     
-    def setUp(self):
-        self.test_data_dir = os.path.join(os.path.dirname(__file__), 'sample_data')
+    @classmethod
+    def setUpClass(cls):
+        cls.test_data_dir = os.path.join(os.path.dirname(__file__), 'sample_data')
         
-        with open(os.path.join(self.test_data_dir, 'sample.genbank'), 'r') as f:
-            self.sample_genbank = f.read()
+        with open(os.path.join(cls.test_data_dir, 'sample.genbank'), 'r') as f:
+            cls.sample_genbank = f.read()
+        cls.sample_genbank_b64 = base64.b64encode(cls.sample_genbank.encode('utf-8')).decode('utf-8')
     
     def test_genbank_to_fasta_string_format(self):
         result = genbank_to_fasta(self.sample_genbank, input_format="string")
@@ -21,9 +30,7 @@ class TestConverters(unittest.TestCase):
         self.assertIn('atgaaatacagctatattgc', result)
     
     def test_genbank_to_fasta_base64_format(self):
-        genbank_b64 = base64.b64encode(self.sample_genbank.encode('utf-8')).decode('utf-8')
-        
-        result = genbank_to_fasta(genbank_b64, input_format="base64")
+        result = genbank_to_fasta(self.sample_genbank_b64, input_format="base64")
         
         self.assertIsInstance(result, str)
         self.assertTrue(result.startswith('>'))
@@ -41,6 +48,22 @@ class TestConverters(unittest.TestCase):
         with self.assertRaises(ConversionError):
             genbank_to_fasta("invalid base64!", input_format="base64")
     
+    def test_validate_genbank_format(self):
+        self.assertTrue(validate_genbank_format(self.sample_genbank))
+        
+        with self.assertRaises(ValidationError):
+            validate_genbank_format("invalid genbank content")
+    
+    def test_validate_genbank_format_preamble_and_trailing_whitespace(self):
+        content = "Exported record\n" + self.sample_genbank + " \n" * 300
+        self.assertTrue(validate_genbank_format(content))
+        self.assertIn('TEST_SEQUENCE', genbank_to_fasta(content, input_format="string"))
+    
+    def test_validate_genbank_format_missing_origin(self):
+        content = self.sample_genbank.replace("ORIGIN", "")
+        with self.assertRaises(ValidationError):
+            validate_genbank_format(content)
+    
     def test_get_conversion_summary(self):
         summary = get_conversion_summary(self.sample_genbank, input_format="string")
         
@@ -61,13 +84,53 @@ class TestConverters(unittest.TestCase):
         self.assertEqual(summary['record_ids'], [])
     
     def test_get_conversion_summary_base64(self):
-        genbank_b64 = base64.b64encode(self.sample_genbank.encode('utf-8')).decode('utf-8')
-        
-        summary = get_conversion_summary(genbank_b64, input_format="base64")
+        summary = get_conversion_summary(self.sample_genbank_b64, input_format="base64")
         
         self.assertEqual(summary['record_count'], 1)
         self.assertEqual(summary['total_length'], 100)
 
 
+
+class _BrokenPool:
+    """Executor whose worker has died: every submit fails as on a real pool."""
+    
+    def __init__(self):
+        self.shut_down = False
+    
+    def submit(self, fn, *args, **kwargs):
+        raise BrokenProcessPool("A child process terminated abruptly")
+    
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shut_down = True
+
+
+class TestWorkers(unittest.TestCase):
+    
+    def tearDown(self):
+        workers._pool = None
+    
+    def test_run_in_pool_replaces_broken_pool(self):
+        broken = _BrokenPool()
+        replacement = ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(replacement.shutdown)
+        workers._pool = broken
+        
+        with patch('src.core.workers._new_pool', return_value=replacement):
+            result = asyncio.run(workers.run_in_pool(len, "ACGT"))
+        
+        self.assertEqual(result, 4)
+        self.assertTrue(broken.shut_down)
+        self.assertIs(workers._pool, replacement)
+    
+    def test_run_in_pool_still_broken_is_503(self):
+        workers._pool = _BrokenPool()
+        
+        with patch('src.core.workers._new_pool', side_effect=lambda: _BrokenPool()):
+            with self.assertRaises(HTTPException) as ctx:
+                asyncio.run(workers.run_in_pool(len, "ACGT"))
+        
+        self.assertEqual(ctx.exception.status_code, 503)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -7,15 +7,18 @@ from src.core.manipulators import (
     get_fasta_summary,
     ManipulationError
 )
+from src.utils.validators import ValidationError
 
 
 class TestManipulators(unittest.TestCase):
     
-    def setUp(self):
-        self.test_data_dir = os.path.join(os.path.dirname(__file__), 'sample_data')
+    @classmethod
+    def setUpClass(cls):
+        cls.test_data_dir = os.path.join(os.path.dirname(__file__), 'sample_data')
         
-        with open(os.path.join(self.test_data_dir, 'sample.fasta'), 'r') as f:
-            self.sample_fasta = f.read()
+        with open(os.path.join(cls.test_data_dir, 'sample.fasta'), 'r') as f:
+            cls.sample_fasta = f.read()
+        cls.sample_fasta_b64 = base64.b64encode(cls.sample_fasta.encode('utf-8')).decode('utf-8')
     
     def test_reverse_complement_fasta_string_format(self):
         result = reverse_complement_fasta(self.sample_fasta, input_format="string")
@@ -29,9 +32,7 @@ class TestManipulators(unittest.TestCase):
         self.assertTrue(any('_rc' in line for line in lines))
     
     def test_reverse_complement_fasta_base64_format(self):
-        fasta_b64 = base64.b64encode(self.sample_fasta.encode('utf-8')).decode('utf-8')
-        
-        result = reverse_complement_fasta(fasta_b64, input_format="base64")
+        result = reverse_complement_fasta(self.sample_fasta_b64, input_format="base64")
         
         self.assertIsInstance(result, str)
         self.assertTrue(result.startswith('>'))
@@ -49,6 +50,40 @@ class TestManipulators(unittest.TestCase):
         with self.assertRaises(ManipulationError):
             reverse_complement_fasta("invalid base64!", input_format="base64")
     
+    def test_reverse_complement_fasta_matches_biopython(self):
+        import io
+        from Bio import SeqIO
+        from Bio.SeqRecord import SeqRecord
+        
+        for content in (self.sample_fasta, ">mixed case\nacgtRYKMbdhvN-\n>empty\n\n>rna\nACGU\n"):
+            expected = io.StringIO()
+            SeqIO.write(
+                [
+                    SeqRecord(
+                        record.seq.reverse_complement(),
+                        id=record.id + "_rc",
+                        description=record.description + " (reverse complement)"
+                    )
+                    for record in SeqIO.parse(io.StringIO(content), "fasta")
+                ],
+                expected,
+                "fasta"
+            )
+            
+            self.assertEqual(reverse_complement_fasta(content), expected.getvalue())
+    
+    def test_reverse_complement_fasta_validate(self):
+        result = reverse_complement_fasta(self.sample_fasta, input_format="string", validate=True)
+        self.assertIn('_rc', result)
+        
+        with self.assertRaises(ValidationError):
+            reverse_complement_fasta(">seq1\nACGTXYZ\n", input_format="string", validate=True)
+    
+    def test_reverse_complement_fasta_validate_internal_whitespace(self):
+        for content in (">s1\nAC GT\n", ">s1\nAC\tGT\n"):
+            with self.assertRaises(ValidationError):
+                reverse_complement_fasta(content, input_format="string", validate=True)
+    
     def test_extract_subsequence_valid(self):
         result = extract_subsequence(
             self.sample_fasta,
@@ -67,6 +102,28 @@ class TestManipulators(unittest.TestCase):
         sequence_line = lines[1] if len(lines) > 1 else ""
         self.assertEqual(len(sequence_line), 10)
     
+    def test_extract_subsequence_indexed_lookup(self):
+        from src.core.fasta_index import get_index
+        
+        content = ">dup first\nAAAACCCC\n>other\nGGGG\n>dup second\nTTTT\n"
+        
+        index = get_index(content.encode("ascii"))
+        self.assertIs(get_index(content.encode("ascii")), index)
+        self.assertEqual(set(index.records), {"dup", "other"})
+        
+        result = extract_subsequence(content, "dup", 2, 6, input_format="string")
+        self.assertEqual(result, ">dup_subseq_2_6 dup first (subsequence 2-6)\nAACC\n")
+    
+    def test_extract_subsequence_internal_whitespace(self):
+        content = ">s1\nAC GT\tAA\n"
+        
+        with self.assertRaises(ValidationError):
+            extract_subsequence(content, "s1", 0, 3, input_format="string", validate=True)
+        
+        # Unvalidated input is read like Biopython reads it
+        result = extract_subsequence(content, "s1", 2, 5, input_format="string")
+        self.assertEqual(result, ">s1_subseq_2_5 s1 (subsequence 2-5)\nGTA\n")
+    
     def test_extract_subsequence_invalid_sequence_id(self):
         with self.assertRaises(ManipulationError):
             extract_subsequence(
@@ -132,9 +189,7 @@ class TestManipulators(unittest.TestCase):
         self.assertEqual(summary['sequences'], [])
     
     def test_get_fasta_summary_base64(self):
-        fasta_b64 = base64.b64encode(self.sample_fasta.encode('utf-8')).decode('utf-8')
-        
-        summary = get_fasta_summary(fasta_b64, input_format="base64")
+        summary = get_fasta_summary(self.sample_fasta_b64, input_format="base64")
         
         self.assertEqual(summary['record_count'], 3)
         self.assertGreater(summary['total_length'], 0)
@@ -1,26 +1,68 @@
 """
 Tests for MCP endpoints.
 """
+import asyncio
+
 import pytest
-from fastapi.testclient import TestClient
-from src.main import app
 
 
-client = TestClient(app)
+pytestmark = pytest.mark.anyio
+
+
+ENDPOINT_FIELDS = [
+    ("/mcp/tools", ["tools", "count", "generated_at"]),
+    ("/mcp/manifest", [
+        "protocol_version", "server_version", "server_name",
+        "description", "features", "capabilities", "tools_summary", "generated_at"
+    ]),
+    ("/mcp/status", [
+        "status", "timestamp", "uptime_seconds", "services",
+        "tools", "system"
+    ]),
+    ("/mcp/info", [
+        "name", "description", "version", "protocol_version",
+        "endpoints", "documentation"
+    ]),
+]
+
+
+@pytest.fixture(scope="session")
+async def tools_payload(aclient):
+    """/mcp/tools fetched and parsed once for every test that inspects the tool list"""
+    response = await aclient.get("/mcp/tools")
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.fixture(scope="session")
+async def manifest_payload(aclient):
+    """/mcp/manifest fetched and parsed once for the manifest tests"""
+    response = await aclient.get("/mcp/manifest")
+    assert response.status_code == 200
+    return response.json()
 
 
 class TestMCPEndpoints:
     """Test MCP protocol endpoints"""
 
-    def test_mcp_tools_endpoint(self):
-        """Test /mcp/tools endpoint returns correct structure"""
-        response = client.get("/mcp/tools")
-        assert response.status_code == 200
-        
-        data = response.json()
-        assert "tools" in data
-        assert "count" in data
-        assert "generated_at" in data
+    async def test_mcp_endpoint_structure(self, aclient):
+        """Test each MCP endpoint returns a JSON object with its required fields"""
+        responses = await asyncio.gather(
+            *(aclient.get(endpoint) for endpoint, _ in ENDPOINT_FIELDS)
+        )
+        
+        for (endpoint, required_fields), response in zip(ENDPOINT_FIELDS, responses):
+            assert response.status_code == 200, endpoint
+            assert response.headers["content-type"] == "application/json"
+            
+            data = response.json()
+            assert isinstance(data, dict)
+            for field in required_fields:
+                assert field in data, f"{endpoint} missing required field: {field}"
+
+    async def test_mcp_tools_endpoint(self, tools_payload):
+        """Test /mcp/tools lists complete tool descriptors"""
+        data = tools_payload
         
         # Verify we have tools
         assert isinstance(data["tools"], list)
@@ -39,39 +81,20 @@ class TestMCPEndpoints:
             assert isinstance(tool["output_schema"], dict)
             assert isinstance(tool["tags"], list)
 
-    def test_mcp_manifest_endpoint(self):
-        """Test /mcp/manifest endpoint returns correct structure"""
-        response = client.get("/mcp/manifest")
-        assert response.status_code == 200
-        
-        data = response.json()
-        required_fields = [
-            "protocol_version", "server_version", "server_name", 
-            "description", "features", "capabilities", "tools_summary", "generated_at"
-        ]
-        
-        for field in required_fields:
-            assert field in data, f"Manifest missing required field: {field}"
-        
-        # Verify specific values
+    async def test_mcp_manifest_values(self, manifest_payload):
+        """Test /mcp/manifest identifies the server and its capabilities"""
+        data = manifest_payload
         assert data["protocol_version"] == "2025-06-18"
         assert data["server_name"] == "FastX-MCP"
         assert isinstance(data["capabilities"], dict)
         assert isinstance(data["tools_summary"], dict)
 
-    def test_mcp_status_endpoint(self):
-        """Test /mcp/status endpoint returns correct structure"""
-        response = client.get("/mcp/status")
+    async def test_mcp_status_values(self, aclient):
+        """Test /mcp/status reports health, services and tool counts"""
+        response = await aclient.get("/mcp/status")
         assert response.status_code == 200
         
         data = response.json()
-        required_fields = [
-            "status", "timestamp", "uptime_seconds", "services", 
-            "tools", "system"
-        ]
-        
-        for field in required_fields:
-            assert field in data, f"Status missing required field: {field}"
         
         # Verify status is healthy
         assert data["status"] == "healthy"
@@ -86,32 +109,19 @@ class TestMCPEndpoints:
         assert "available" in data["tools"]
         assert "disabled" in data["tools"]
 
-    def test_mcp_info_endpoint(self):
-        """Test /mcp/info endpoint returns correct structure"""
-        response = client.get("/mcp/info")
+    async def test_mcp_info_endpoints(self, aclient):
+        """Test /mcp/info lists every MCP endpoint"""
+        response = await aclient.get("/mcp/info")
         assert response.status_code == 200
         
         data = response.json()
-        required_fields = [
-            "name", "description", "version", "protocol_version",
-            "endpoints", "documentation"
-        ]
-        
-        for field in required_fields:
-            assert field in data, f"Info missing required field: {field}"
-        
-        # Verify endpoints structure
         expected_endpoints = ["tools", "manifest", "status", "info"]
         for endpoint in expected_endpoints:
             assert endpoint in data["endpoints"]
 
-    def test_mcp_tools_content_validation(self):
+    async def test_mcp_tools_content_validation(self, tools_payload):
         """Test that tools contain expected tools from our registry"""
-        response = client.get("/mcp/tools")
-        assert response.status_code == 200
-        
-        data = response.json()
-        tools = data["tools"]
+        tools = tools_payload["tools"]
         
         # Get tool names
         tool_names = [tool["name"] for tool in tools]
@@ -128,13 +138,9 @@ class TestMCPEndpoints:
         for expected_tool in expected_tools:
             assert expected_tool in tool_names, f"Expected tool {expected_tool} not found"
 
-    def test_mcp_schema_structure(self):
+    async def test_mcp_schema_structure(self, tools_payload):
         """Test that tool schemas have expected structure"""
-        response = client.get("/mcp/tools")
-        assert response.status_code == 200
-        
-        data = response.json()
-        tools = data["tools"]
+        tools = tools_payload["tools"]
         
         for tool in tools:
             input_schema = tool["input_schema"]
@@ -149,27 +155,3 @@ class TestMCPEndpoints:
             # Verify schemas have type information
             assert "type" in input_schema or "$defs" in input_schema
             assert "type" in output_schema or "$defs" in output_schema
-
-    def test_mcp_manifest_protocol_version(self):
-        """Test that manifest uses correct MCP protocol version"""
-        response = client.get("/mcp/manifest")
-        assert response.status_code == 200
-        
-        data = response.json()
-        assert data["protocol_version"] == "2025-06-18"
-
-    def test_mcp_endpoints_error_handling(self):
-        """Test that MCP endpoints handle errors gracefully"""
-        # All endpoints should return JSON even on internal errors
-        # This test verifies structure exists and endpoints are accessible
-        
-        endpoints = ["/mcp/tools", "/mcp/manifest", "/mcp/status", "/mcp/info"]
-        
-        for endpoint in endpoints:
-            response = client.get(endpoint)
-            assert response.status_code == 200
-            assert response.headers["content-type"] == "application/json"
-            
-            # Should be valid JSON
-            data = response.json()
-            assert isinstance(data, dict)
\ No newline at end of file
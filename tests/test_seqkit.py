@@ -1,61 +1,192 @@
+import asyncio
 import unittest
 import os
 import base64
-from unittest.mock import patch, MagicMock
+import io
+from functools import lru_cache
+from types import SimpleNamespace
+from unittest.mock import patch
 from src.core.seqkit_wrapper import (
     run_seqkit_stats,
+    run_seqkit_stats_cached,
+    run_seqkit_stats_batch,
     run_seqkit_command,
     validate_seqkit_installation,
     get_seqkit_version,
+    get_seqkit_status,
     SeqkitError
 )
+from src.core import seqkit_wrapper
+from src.core.stats_batcher import BATCH_AUDIT_ENDPOINT, DynBatcher
+from src.utils.encoding import iter_decoded
+
+
+TEST_DATA_DIR = os.path.join(os.path.dirname(__file__), 'sample_data')
+
+# Static subprocess.run results; the wrapper only reads these three attributes
+_VERSION_OK = SimpleNamespace(returncode=0, stdout="seqkit v2.0.0\n", stderr="")
+_FAILED = SimpleNamespace(returncode=1, stdout="", stderr="")
+_STATS_TABULAR = SimpleNamespace(returncode=0, stdout="file\tnum_seqs\n-\t3\n", stderr="")
+_STATS_JSON = SimpleNamespace(
+    returncode=0,
+    stdout='[{"file": "test.fastq", "format": "FASTQ", "type": "DNA", "num_seqs": 3, "sum_len": 100, "min_len": 30, "avg_len": 33.3, "max_len": 40}]',
+    stderr=""
+)
+_STATS_TEXT = SimpleNamespace(
+    returncode=0,
+    stdout="file\tformat\ttype\tnum_seqs\tsum_len\tmin_len\tavg_len\tmax_len\ntest.fastq\tFASTQ\tDNA\t3\t100\t30\t33.3\t40",
+    stderr=""
+)
+_STATS_FAILED = SimpleNamespace(returncode=1, stdout="", stderr="Error: invalid file format")
+_INVALID_JSON = SimpleNamespace(returncode=0, stdout="invalid json", stderr="")
+_COMMAND_OK = SimpleNamespace(returncode=0, stdout="command output", stderr="")
+_COMMAND_FAILED = SimpleNamespace(returncode=1, stdout="", stderr="Command failed")
+
+
+class _RecordingStdin(io.BytesIO):
+    """Stand-in for a process's stdin that keeps what was written after close."""
+    
+    def close(self):
+        self.received = self.getvalue()
+        super().close()
+
+
+@lru_cache(maxsize=None)
+def _sample_fastq():
+    with open(os.path.join(TEST_DATA_DIR, 'sample.fastq'), 'r') as f:
+        return f.read()
+
+
+@lru_cache(maxsize=None)
+def _sample_fastq_b64():
+    return base64.b64encode(_sample_fastq().encode('utf-8')).decode('utf-8')
 
 
 class TestSeqkitWrapper(unittest.TestCase):
     
+    # Read on first use: the installation/version tests never touch the sample
+    @property
+    def sample_fastq(self):
+        return _sample_fastq()
+    
+    @property
+    def sample_fastq_b64(self):
+        return _sample_fastq_b64()
+    
     def setUp(self):
-        self.test_data_dir = os.path.join(os.path.dirname(__file__), 'sample_data')
-        
-        with open(os.path.join(self.test_data_dir, 'sample.fastq'), 'r') as f:
-            self.sample_fastq = f.read()
+        # Every test runs against a fake seqkit; tests configure the mock
+        patcher = patch('src.core.seqkit_wrapper.subprocess.run')
+        self.mock_run = patcher.start()
+        self.addCleanup(patcher.stop)
     
-    @patch('src.core.seqkit_wrapper.subprocess.run')
-    def test_validate_seqkit_installation_success(self, mock_run):
-        mock_run.return_value = MagicMock(returncode=0, stdout="seqkit v2.0.0")
+    def test_validate_seqkit_installation_success(self):
+        self.mock_run.return_value = _VERSION_OK
         
         result = validate_seqkit_installation()
         
         self.assertTrue(result)
-        mock_run.assert_called_once()
+        self.mock_run.assert_called_once()
     
-    @patch('src.core.seqkit_wrapper.subprocess.run')
-    def test_validate_seqkit_installation_failure(self, mock_run):
-        mock_run.return_value = MagicMock(returncode=1)
+    def test_validate_seqkit_installation_failure(self):
+        self.mock_run.return_value = _FAILED
         
         result = validate_seqkit_installation()
         
         self.assertFalse(result)
     
-    @patch('src.core.seqkit_wrapper.subprocess.run')
-    def test_get_seqkit_version_success(self, mock_run):
-        mock_run.return_value = MagicMock(returncode=0, stdout="seqkit v2.0.0\n")
+    def test_get_seqkit_version_success(self):
+        self.mock_run.return_value = _VERSION_OK
         
         result = get_seqkit_version()
         
         self.assertEqual(result, "seqkit v2.0.0")
     
-    @patch('src.core.seqkit_wrapper.subprocess.run')
-    def test_get_seqkit_version_failure(self, mock_run):
-        mock_run.return_value = MagicMock(returncode=1)
+    def test_get_seqkit_version_failure(self):
+        self.mock_run.return_value = _FAILED
         
         result = get_seqkit_version()
         
         self.assertIsNone(result)
     
-    @patch('src.core.seqkit_wrapper.subprocess.run')
-    def test_run_seqkit_stats_json_format(self, mock_run):
-        mock_stats = '[{"file": "test.fastq", "format": "FASTQ", "type": "DNA", "num_seqs": 3, "sum_len": 100, "min_len": 30, "avg_len": 33.3, "max_len": 40}]'
-        mock_run.return_value = MagicMock(returncode=0, stdout=mock_stats)
+    def test_get_seqkit_status_cached(self):
+        self.mock_run.return_value = _VERSION_OK
+        seqkit_wrapper._seqkit_status = None
+        
+        self.assertEqual(get_seqkit_status(), (True, "seqkit v2.0.0"))
+        self.assertEqual(get_seqkit_status(), (True, "seqkit v2.0.0"))
+        self.mock_run.assert_called_once()
+        
+        self.mock_run.return_value = _FAILED
+        self.assertEqual(get_seqkit_status(refresh=True), (False, None))
+        seqkit_wrapper._seqkit_status = None
+    
+    def test_run_seqkit_stats_cached(self):
+        self.mock_run.return_value = _STATS_TABULAR
+        seqkit_wrapper._stats_cache.clear()
+        
+        stats, cache_hit = run_seqkit_stats_cached(self.sample_fastq, output_format="text")
+        self.assertFalse(cache_hit)
+        self.assertEqual(run_seqkit_stats_cached(self.sample_fastq, output_format="text"), (stats, True))
+        self.mock_run.assert_called_once()
+        seqkit_wrapper._stats_cache.clear()
+    
+    def test_run_seqkit_stats_batch(self):
+        def fake_stats(cmd, **kwargs):
+            files = cmd[3:]
+            rows = [f"{path}\t{i + 1}" for i, path in enumerate(files)]
+            return SimpleNamespace(returncode=0, stdout="file\tnum_seqs\n" + "\n".join(rows) + "\n", stderr="")
+        self.mock_run.side_effect = fake_stats
+        
+        results = run_seqkit_stats_batch([
+            (self.sample_fastq, "string"),
+            ("invalid base64!", "base64"),
+            (self.sample_fastq_b64, "base64"),
+        ])
+        
+        self.mock_run.assert_called_once()
+        self.assertEqual(results[0], "file\tnum_seqs\n-\t1\n")
+        self.assertIsInstance(results[1], SeqkitError)
+        self.assertEqual(results[2], "file\tnum_seqs\n-\t2\n")
+    
+    def test_dyn_batcher_audits_failed_items(self):
+        def process_batch(items):
+            return [SeqkitError("bad") if item == "bad" else item.upper() for item in items]
+        
+        async def run():
+            batcher = DynBatcher(process_batch, max_delay=0.05)
+            batcher.start()
+            try:
+                return await asyncio.gather(
+                    batcher.submit("ok"), batcher.submit("bad"), return_exceptions=True
+                )
+            finally:
+                await batcher.stop()
+        
+        with patch("src.core.stats_batcher.audit_queue.enqueue") as enqueue:
+            results = asyncio.run(run())
+        
+        self.assertEqual(results[0], "OK")
+        self.assertIsInstance(results[1], SeqkitError)
+        
+        enqueue.assert_called_once()
+        entry = enqueue.call_args[0][0]
+        self.assertEqual(entry["endpoint"], BATCH_AUDIT_ENDPOINT)
+        self.assertFalse(entry["success"])
+        self.assertEqual(entry["result_summary"], {"failed_items": 1})
+    
+    def test_run_piped_async(self):
+        returncode, stdout, _ = asyncio.run(
+            seqkit_wrapper._run_piped_async(["cat"], iter_decoded(self.sample_fastq_b64), timeout=10)
+        )
+        
+        self.assertEqual(returncode, 0)
+        self.assertEqual(stdout, self.sample_fastq)
+        
+        with self.assertRaises(SeqkitError):
+            asyncio.run(seqkit_wrapper._run_piped_async(["cat"], iter_decoded("invalid!"), timeout=10))
+    
+    def test_run_seqkit_stats_json_format(self):
+        self.mock_run.return_value = _STATS_JSON
         
         result = run_seqkit_stats(self.sample_fastq, input_format="string", output_format="json")
         
@@ -64,10 +195,8 @@ class TestSeqkitWrapper(unittest.TestCase):
         self.assertIn('num_seqs', result[0])
         self.assertEqual(result[0]['num_seqs'], 3)
     
-    @patch('src.core.seqkit_wrapper.subprocess.run')
-    def test_run_seqkit_stats_text_format(self, mock_run):
-        mock_stats = "file\tformat\ttype\tnum_seqs\tsum_len\tmin_len\tavg_len\tmax_len\ntest.fastq\tFASTQ\tDNA\t3\t100\t30\t33.3\t40"
-        mock_run.return_value = MagicMock(returncode=0, stdout=mock_stats)
+    def test_run_seqkit_stats_text_format(self):
+        self.mock_run.return_value = _STATS_TEXT
         
         result = run_seqkit_stats(self.sample_fastq, input_format="string", output_format="text")
         
@@ -75,19 +204,26 @@ class TestSeqkitWrapper(unittest.TestCase):
         self.assertIn('output', result)
         self.assertIn('FASTQ', result['output'])
     
-    @patch('src.core.seqkit_wrapper.subprocess.run')
-    def test_run_seqkit_stats_base64_input(self, mock_run):
-        fastq_b64 = base64.b64encode(self.sample_fastq.encode('utf-8')).decode('utf-8')
-        mock_stats = '[{"file": "test.fastq", "num_seqs": 3}]'
-        mock_run.return_value = MagicMock(returncode=0, stdout=mock_stats)
+    def test_run_seqkit_stats_base64_input(self):
+        # Decoded base64 is fed to a Popen'd seqkit's stdin from a thread
+        stdin = _RecordingStdin()
+        proc = SimpleNamespace(
+            stdin=stdin,
+            returncode=0,
+            communicate=lambda timeout=None: (_STATS_TABULAR.stdout.encode(), b"")
+        )
         
-        result = run_seqkit_stats(fastq_b64, input_format="base64", output_format="json")
+        with patch('src.core.seqkit_wrapper.subprocess.Popen', return_value=proc) as mock_popen:
+            result = run_seqkit_stats(self.sample_fastq_b64, input_format="base64", output_format="json")
         
-        self.assertIsInstance(result, list)
+        self.assertEqual(mock_popen.call_args[0][0], ["seqkit", "stats", "-T", "-"])
+        self.assertEqual(stdin.received, self.sample_fastq.encode('utf-8'))
+        self.assertTrue(stdin.closed)
+        self.mock_run.assert_not_called()
+        self.assertEqual(result, {"file": "-", "num_seqs": "3"})
     
-    @patch('src.core.seqkit_wrapper.subprocess.run')
-    def test_run_seqkit_stats_command_failure(self, mock_run):
-        mock_run.return_value = MagicMock(returncode=1, stderr="Error: invalid file format")
+    def test_run_seqkit_stats_command_failure(self):
+        self.mock_run.return_value = _STATS_FAILED
         
         with self.assertRaises(SeqkitError):
             run_seqkit_stats(self.sample_fastq, input_format="string")
@@ -96,16 +232,14 @@ class TestSeqkitWrapper(unittest.TestCase):
         with self.assertRaises(SeqkitError):
             run_seqkit_stats("invalid base64!", input_format="base64")
     
-    @patch('src.core.seqkit_wrapper.subprocess.run')
-    def test_run_seqkit_stats_invalid_json(self, mock_run):
-        mock_run.return_value = MagicMock(returncode=0, stdout="invalid json")
+    def test_run_seqkit_stats_invalid_json(self):
+        self.mock_run.return_value = _INVALID_JSON
         
         with self.assertRaises(SeqkitError):
             run_seqkit_stats(self.sample_fastq, input_format="string", output_format="json")
     
-    @patch('src.core.seqkit_wrapper.subprocess.run')
-    def test_run_seqkit_command_success(self, mock_run):
-        mock_run.return_value = MagicMock(returncode=0, stdout="command output")
+    def test_run_seqkit_command_success(self):
+        self.mock_run.return_value = _COMMAND_OK
         
         result = run_seqkit_command(
             self.sample_fastq,
@@ -115,25 +249,23 @@ class TestSeqkitWrapper(unittest.TestCase):
         )
         
         self.assertEqual(result, "command output")
-        mock_run.assert_called_once()
+        self.mock_run.assert_called_once()
         
-        call_args = mock_run.call_args[0][0]
+        call_args = self.mock_run.call_args[0][0]
         self.assertIn("seqkit", call_args)
         self.assertIn("head", call_args)
         self.assertIn("-n", call_args)
         self.assertIn("2", call_args)
     
-    @patch('src.core.seqkit_wrapper.subprocess.run')
-    def test_run_seqkit_command_failure(self, mock_run):
-        mock_run.return_value = MagicMock(returncode=1, stderr="Command failed")
+    def test_run_seqkit_command_failure(self):
+        self.mock_run.return_value = _COMMAND_FAILED
         
         with self.assertRaises(SeqkitError):
             run_seqkit_command(self.sample_fastq, "invalid_command")
     
-    @patch('src.core.seqkit_wrapper.subprocess.run')
-    def test_run_seqkit_command_timeout(self, mock_run):
+    def test_run_seqkit_command_timeout(self):
         from subprocess import TimeoutExpired
-        mock_run.side_effect = TimeoutExpired("seqkit", 60)
+        self.mock_run.side_effect = TimeoutExpired("seqkit", 60)
         
         with self.assertRaises(SeqkitError):
             run_seqkit_command(self.sample_fastq, "stats")